@@ -0,0 +1,59 @@
+"""
+Micro-benchmarks for the render path: icon loading and lookup, and
+`create_window_svg` with the weather already cached (no network), with and
+without a rendered-window cache hit.
+
+    python -m benchmarks.bench_render
+"""
+
+import asyncio
+
+from window import create_window_svg, create_window_svg_sync
+from window.icons import get_celestial_body_svg, get_weather_icon_svg, load_icons
+from window.render import render_cache, render_window_svg
+from window.weather import get_weather_cache_key, weather_cache
+
+from .common import bench, make_weather_data
+
+LAT, LON = 40.7128, -74.006
+
+
+def main():
+    weather_data = make_weather_data(LAT, LON)
+    icon = weather_data["weather"][0]["icon"]
+    weather_cache.set(get_weather_cache_key("metric", LAT, LON, "en"), weather_data)
+
+    def render_uncached():
+        render_cache.clear()
+        return create_window_svg_sync("metric", LAT, LON, "en")
+
+    loop = asyncio.new_event_loop()
+
+    results = [
+        ("load_icons (cold, from disk)", bench(load_icons, number=50)),
+        ("get_celestial_body_svg", bench(lambda: get_celestial_body_svg(icon))),
+        ("get_weather_icon_svg", bench(lambda: get_weather_icon_svg(icon))),
+        ("render_window_svg", bench(lambda: render_window_svg(weather_data))),
+        ("create_window_svg_sync (miss)", bench(render_uncached, number=500)),
+        (
+            "create_window_svg_sync (hit)",
+            bench(lambda: create_window_svg_sync("metric", LAT, LON, "en")),
+        ),
+        (
+            "create_window_svg (hit)",
+            bench(
+                lambda: loop.run_until_complete(
+                    create_window_svg("metric", LAT, LON, "en")
+                ),
+                number=500,
+            ),
+        ),
+    ]
+    loop.close()
+
+    for name, micros in results:
+        print(f"{name:<32} {micros:10.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Sky gradient lookup: the original per-request `getRealisticColorGradient`
+against the precomputed per-day colour table in `window.sky`.
+
+Before timing anything, the table is checked against `getRealisticColorGradient`
+for every minute of a few days with different sunrise/sunset times.
+
+    python -m benchmarks.bench_sky
+"""
+
+from datetime import datetime, timedelta
+
+from window.colors import getRealisticColorGradient
+from window.sky import get_sky_gradient, get_sky_table
+
+from .common import bench
+
+DAY = datetime(2024, 3, 20)
+SUN_TIMES = [
+    # (sunrise, sunset) offsets from midnight
+    (timedelta(hours=6, minutes=2, seconds=17), timedelta(hours=18, minutes=11)),
+    (timedelta(hours=4, minutes=25, seconds=3), timedelta(hours=20, minutes=31)),
+    (timedelta(hours=8, minutes=48, seconds=51), timedelta(hours=15, minutes=53)),
+    (timedelta(hours=0, minutes=30), timedelta(hours=23, minutes=50, seconds=9)),
+]
+
+
+def check_equivalence():
+    checked = 0
+    for sunrise_offset, sunset_offset in SUN_TIMES:
+        sunrise_time = DAY + sunrise_offset
+        sunset_time = DAY + sunset_offset
+        for minute in range(24 * 60):
+            now = DAY + timedelta(minutes=minute)
+            expected = getRealisticColorGradient(sunrise_time, sunset_time, now)
+            actual = get_sky_gradient(sunrise_time, sunset_time, now)
+            assert actual == expected, (
+                sunrise_time,
+                sunset_time,
+                now,
+                actual,
+                expected,
+            )
+            checked += 1
+
+    return checked
+
+
+def main():
+    print(f"equivalent for {check_equivalence()} minutes")
+
+    sunrise_time = DAY + SUN_TIMES[0][0]
+    sunset_time = DAY + SUN_TIMES[0][1]
+    now = DAY + timedelta(hours=13, minutes=37)
+
+    get_sky_table.cache_clear()
+    build = bench(
+        lambda: get_sky_table.__wrapped__(sunrise_time, sunset_time, DAY.date()),
+        number=200,
+    )
+    before = bench(lambda: getRealisticColorGradient(sunrise_time, sunset_time, now))
+    after = bench(lambda: get_sky_gradient(sunrise_time, sunset_time, now))
+
+    print(f"table build:               {build:8.2f} µs (once per sunrise/sunset/day)")
+    print(f"getRealisticColorGradient: {before:8.2f} µs/lookup")
+    print(
+        f"get_sky_gradient:          {after:8.2f} µs/lookup ({before / after:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Cold start: how long `import main` takes, and how long a fresh uvicorn
+process takes to serve its first window, with and without the startup
+warm-up.
+
+    python -m benchmarks.bench_startup --runs 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+from .load_test import start_process, wait_until_up
+
+IMPORT_SCRIPT = """
+import time
+start = time.perf_counter()
+import main
+print(time.perf_counter() - start)
+"""
+
+
+def measure_import():
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def slowest_imports(limit: int = 8):
+    # -X importtime lines are "import time: self | cumulative | name", with
+    # the name indented two spaces per level of nesting
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    imports = []
+    for line in stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2][1:]
+        # Only what main imports directly
+        if name.startswith("  ") and not name.startswith("    "):
+            imports.append((int(parts[1]) / 1e6, name.strip()))
+    return sorted(imports, reverse=True)[:limit]
+
+
+async def poll(client: httpx.AsyncClient, path: str, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            response = await client.get(path)
+            if response.status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.01)
+    raise TimeoutError(f"{path} did not return 200 within {timeout}s")
+
+
+async def measure_first_render(port: int, stub_url: str, warmup: bool):
+    # The default location is what gets warmed, so that's what is requested
+    env = {
+        "OPEN_WEATHER_BASE_URL": f"{stub_url}/data/2.5",
+        "OPEN_WEATHER_API_KEY": "stub",
+    }
+    if not warmup:
+        env["WARMUP_LOCATIONS"] = ""
+
+    started = time.monotonic()
+    process = start_process(
+        ["-m", "uvicorn", "main:app", f"--port={port}", "--log-level=warning"],
+        env=env,
+    )
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", timeout=30
+        ) as client:
+            await poll(client, "/ready")
+            ready = time.monotonic() - started
+
+            request_started = time.monotonic()
+            response = await client.get("/api/")
+            response.raise_for_status()
+            first_render = time.monotonic() - request_started
+        return ready, ready + first_render, first_render
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def format_ms(values: list[float]):
+    return f"{statistics.median(values) * 1000:7.1f} ms (min {min(values) * 1000:.1f})"
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--stub-port", type=int, default=8001)
+    parser.add_argument("--latency", default="80", help="stub latency, ms")
+    args = parser.parse_args()
+
+    imports = [measure_import() for _ in range(args.runs)]
+    print(f"import main:          {format_ms(imports)}")
+    for seconds, name in slowest_imports():
+        print(f"  {name:<20}{seconds * 1000:7.1f} ms")
+
+    stub_url = f"http://127.0.0.1:{args.stub_port}"
+    stub = start_process(
+        [
+            "-m",
+            "benchmarks.stub_server",
+            f"--port={args.stub_port}",
+            f"--latency={args.latency}",
+        ]
+    )
+    try:
+        await wait_until_up(stub_url)
+        for warmup in (False, True):
+            results = [
+                await measure_first_render(args.port, stub_url, warmup)
+                for _ in range(args.runs)
+            ]
+            ready, first_window, first_request = zip(*results)
+            print(f"warm-up {'on' if warmup else 'off'}:")
+            print(f"  spawn to ready:     {format_ms(ready)}")
+            print(f"  spawn to 1st window:{format_ms(first_window)}")
+            print(f"  1st /api/ request:  {format_ms(first_request)}")
+    finally:
+        stub.terminate()
+        stub.wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+"""
+Per-render cost of the window SVG template, before and after precompiling it.
+
+"before" mirrors the original implementation: the full template is re-formatted
+on every render and icons are read from disk each time. "after" joins the
+pre-encoded template segments with icons from the in-memory registry.
+
+    python -m benchmarks.bench_template
+"""
+
+import os
+
+from window.icons import SVGS_DIR, get_celestial_body_svg, get_weather_icon_svg
+from window.template import WINDOW_SVG, WINDOW_SVG_SOURCE, SVGTemplate
+
+from .common import bench
+
+ICON = "10d"
+VALUES = {
+    "start_color": "rgb(139, 152, 206)",
+    "end_color": "rgb(86, 216, 255)",
+    # Only the forecast timeline animates the gradient
+    "start_color_animation": "",
+    "end_color_animation": "",
+    "text_color": "black",
+    "location": "New York",
+    "currently": "21.5°C, light rain",
+}
+
+
+def read_icon_from_disk(name: str):
+    file_path = os.path.join(SVGS_DIR, f"{name}.svg")
+    if os.path.exists(file_path):
+        with open(file_path, "r") as file:
+            return file.read()
+    return None
+
+
+def render_before():
+    celestial_body_svg = read_icon_from_disk("moon" if ICON[-1] == "n" else "sun")
+    weather_icon_svg = read_icon_from_disk(f"weather-{ICON[:-1]}")
+    return WINDOW_SVG_SOURCE.format(
+        celestial_body_svg=celestial_body_svg or "",
+        weather_icon_svg=weather_icon_svg or "",
+        **VALUES,
+    ).encode()
+
+
+def render_after():
+    return WINDOW_SVG.render(
+        celestial_body_svg=get_celestial_body_svg(ICON),
+        weather_icon_svg=get_weather_icon_svg(ICON) or b"",
+        **VALUES,
+    )
+
+
+def main():
+    # Same markup when neither side is minified
+    unminified = SVGTemplate(WINDOW_SVG_SOURCE).render(
+        celestial_body_svg=read_icon_from_disk("sun"),
+        weather_icon_svg=read_icon_from_disk(f"weather-{ICON[:-1]}"),
+        **VALUES,
+    )
+    assert render_before() == unminified
+
+    before = bench(render_before)
+    after = bench(render_after)
+    print(f"before: {before:8.2f} µs/render")
+    print(f"after:  {after:8.2f} µs/render ({before / after:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
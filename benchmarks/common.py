@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta, timezone
+import timeit
+import zlib
+
+ICON_CODES = ["01", "02", "03", "04", "09", "10", "11", "13", "50"]
+DESCRIPTIONS = {
+    "01": "clear sky",
+    "02": "few clouds",
+    "03": "scattered clouds",
+    "04": "broken clouds",
+    "09": "shower rain",
+    "10": "rain",
+    "11": "thunderstorm",
+    "13": "snow",
+    "50": "mist",
+}
+
+
+def bench(fn, number: int = 2000, repeat: int = 5):
+    """Best-of-`repeat` time per call, in microseconds."""
+    best = min(timeit.repeat(fn, number=number, repeat=repeat))
+    return best / number * 1e6
+
+
+def make_weather_data(
+    lat: float = 40.7128,
+    lon: float = -74.006,
+    units: str = "metric",
+    now: datetime | None = None,
+):
+    """
+    A deterministic `/data/2.5/weather` payload for a location, shaped like the
+    real OpenWeather response.
+    """
+    now = now or datetime.now()
+    seed = zlib.crc32(f"{lat:.2f},{lon:.2f}".encode())
+
+    # Rough local solar noon from the longitude, in server time
+    utc_offset = now.astimezone().utcoffset() or timedelta()
+    noon = now.replace(hour=12, minute=0, second=0, microsecond=0)
+    noon += utc_offset - timedelta(hours=lon / 15)
+    daylight = timedelta(hours=9 + seed % 7)
+    sunrise = noon - daylight / 2
+    sunset = noon + daylight / 2
+
+    code = ICON_CODES[seed % len(ICON_CODES)]
+    suffix = "d" if sunrise <= now < sunset else "n"
+    temp_c = round(-5 + (seed % 4000) / 100, 2)
+    temp = {
+        "metric": temp_c,
+        "imperial": round(temp_c * 9 / 5 + 32, 2),
+        "standard": round(temp_c + 273.15, 2),
+    }.get(units, temp_c)
+
+    return {
+        "coord": {"lon": lon, "lat": lat},
+        "weather": [
+            {
+                "id": 800,
+                "main": DESCRIPTIONS[code].title(),
+                "description": DESCRIPTIONS[code],
+                "icon": f"{code}{suffix}",
+            }
+        ],
+        "base": "stations",
+        "main": {
+            "temp": temp,
+            "feels_like": temp,
+            "temp_min": temp,
+            "temp_max": temp,
+            "pressure": 1013,
+            "humidity": 40 + seed % 50,
+        },
+        "visibility": 10000,
+        "wind": {"speed": 3.6, "deg": seed % 360},
+        "clouds": {"all": seed % 100},
+        # OpenWeather refreshes observations every 10 minutes or so
+        "dt": int(now.timestamp()) // 600 * 600,
+        "sys": {
+            "type": 2,
+            "id": seed % 100000,
+            "country": "XX",
+            "sunrise": int(sunrise.timestamp()),
+            "sunset": int(sunset.timestamp()),
+        },
+        "timezone": int(lon / 15) * 3600,
+        "id": seed,
+        "name": f"Stub City {seed % 1000}",
+        "cod": 200,
+    }
+
+
+def make_forecast_data(
+    lat: float = 40.7128,
+    lon: float = -74.006,
+    units: str = "metric",
+    now: datetime | None = None,
+):
+    """
+    A deterministic `/data/2.5/forecast` payload: 5 days in 3 hour steps,
+    with the weather changing every few steps.
+    """
+    now = now or datetime.now()
+    current = make_weather_data(lat, lon, units, now)
+    first = int(now.timestamp()) // 10800 * 10800 + 10800
+
+    entries = []
+    for idx in range(40):
+        dt = first + idx * 10800
+        weather = make_weather_data(
+            lat + idx // 4, lon, units, datetime.fromtimestamp(dt)
+        )
+        entries.append(
+            {
+                "dt": dt,
+                "main": weather["main"],
+                "weather": weather["weather"],
+                "clouds": weather["clouds"],
+                "wind": weather["wind"],
+                "dt_txt": datetime.fromtimestamp(dt, timezone.utc).strftime(
+                    "%Y-%m-%d %H:%M:%S"
+                ),
+            }
+        )
+
+    return {
+        "cod": "200",
+        "message": 0,
+        "cnt": len(entries),
+        "list": entries,
+        "city": {
+            "id": current["id"],
+            "name": current["name"],
+            "coord": current["coord"],
+            "country": "XX",
+            "timezone": current["timezone"],
+            "sunrise": current["sys"]["sunrise"],
+            "sunset": current["sys"]["sunset"],
+        },
+    }
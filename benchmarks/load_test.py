@@ -0,0 +1,211 @@
+"""
+End-to-end load test: runs `main:app` under uvicorn against the local
+OpenWeather stub and reports throughput and latency percentiles.
+
+    python -m benchmarks.load_test --duration 20 --concurrency 100 --locations 50
+
+The app is started with the OpenWeather rate limit out of the way. Windows
+that were served without fresh weather anyway are reported from the app's
+/metrics, which with several workers only covers whichever one answered.
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+
+def start_process(args: list[str], env: dict | None = None):
+    return subprocess.Popen(
+        [sys.executable, *args],
+        env={**os.environ, **(env or {})},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.STDOUT,
+    )
+
+
+async def wait_until_up(url: str, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get(url)
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise TimeoutError(f"{url} did not come up within {timeout}s")
+
+
+# Counters for requests that got a 200 without the window being measured
+DEGRADED_COUNTERS = (
+    "livewindow_weather_fallbacks_total",
+    "livewindow_upstream_rejected_total",
+    "livewindow_upstream_short_circuited_total",
+    "livewindow_admission_queue_full_total",
+    "livewindow_admission_deadline_exceeded_total",
+)
+
+
+async def scrape_counters(base_url: str):
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        response = await client.get("/metrics")
+    if response.status_code != 200:
+        return {}
+
+    counters = {}
+    for line in response.text.splitlines():
+        if line.startswith(DEGRADED_COUNTERS):
+            name, value = line.rsplit(" ", 1)
+            counters[name] = float(value)
+    return counters
+
+
+def make_locations(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        f"{rng.uniform(-60, 60):.4f},{rng.uniform(-180, 180):.4f}" for _ in range(count)
+    ]
+
+
+async def run_load(
+    base_url: str, path: str, locations: list[str], duration: float, concurrency: int
+):
+    latencies = []
+    statuses = Counter()
+    received = 0
+    deadline = time.monotonic() + duration
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=30
+    ) as client:
+
+        async def worker():
+            nonlocal received
+            while time.monotonic() < deadline:
+                location = random.choice(locations)
+                start = time.perf_counter()
+                try:
+                    response = await client.get(path, params={"location": location})
+                    statuses[response.status_code] += 1
+                    received += len(response.content)
+                except httpx.HTTPError as exc:
+                    statuses[type(exc).__name__] += 1
+                latencies.append(time.perf_counter() - start)
+
+        started = time.monotonic()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.monotonic() - started
+
+    return latencies, statuses, received, elapsed
+
+
+def report(
+    latencies: list[float],
+    statuses: Counter,
+    received: int,
+    elapsed: float,
+    degraded: dict[str, float],
+):
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    print(f"requests:    {len(latencies)} in {elapsed:.1f}s")
+    print(f"throughput:  {len(latencies) / elapsed:.1f} req/s")
+    print(f"received:    {received / elapsed / 1024:.1f} KiB/s")
+    print(
+        "latency:     "
+        f"p50 {cuts[49] * 1000:.1f} ms, "
+        f"p95 {cuts[94] * 1000:.1f} ms, "
+        f"p99 {cuts[98] * 1000:.1f} ms, "
+        f"max {max(latencies) * 1000:.1f} ms"
+    )
+    print(f"statuses:    {dict(statuses)}")
+    print("degraded:" if degraded else "degraded:    none")
+    for name, count in degraded.items():
+        print(f"  {name:<60}{count:g}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--duration", type=float, default=10, help="seconds")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--locations", type=int, default=20)
+    parser.add_argument("--path", default="/api/")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--stub-port", type=int, default=8001)
+    parser.add_argument("--latency", default="80", help="stub latency, ms")
+    parser.add_argument("--error-rate", default="0", help="stub error rate")
+    parser.add_argument(
+        "--url", help="load test an already running app instead of starting one"
+    )
+    args = parser.parse_args()
+
+    processes = []
+    base_url = args.url
+    try:
+        if base_url is None:
+            stub_url = f"http://127.0.0.1:{args.stub_port}"
+            processes.append(
+                start_process(
+                    [
+                        "-m",
+                        "benchmarks.stub_server",
+                        f"--port={args.stub_port}",
+                        f"--latency={args.latency}",
+                        f"--error-rate={args.error_rate}",
+                    ]
+                )
+            )
+            processes.append(
+                start_process(
+                    [
+                        "-m",
+                        "uvicorn",
+                        "main:app",
+                        f"--port={args.port}",
+                        f"--workers={args.workers}",
+                        "--log-level=warning",
+                    ],
+                    env={
+                        "OPEN_WEATHER_BASE_URL": f"{stub_url}/data/2.5",
+                        "OPEN_WEATHER_API_KEY": "stub",
+                        # Measure the app, not our OpenWeather plan's quota
+                        "WEATHER_RATE_LIMIT": "1000000",
+                        "WEATHER_RATE_BURST": "1000000",
+                    },
+                )
+            )
+            base_url = f"http://127.0.0.1:{args.port}"
+            await wait_until_up(stub_url)
+
+        await wait_until_up(base_url)
+        before = await scrape_counters(base_url)
+        results = await run_load(
+            base_url,
+            args.path,
+            make_locations(args.locations),
+            args.duration,
+            args.concurrency,
+        )
+        after = await scrape_counters(base_url)
+        degraded = {
+            name: value - before.get(name, 0)
+            for name, value in sorted(after.items())
+            if value - before.get(name, 0)
+        }
+        report(*results, degraded)
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,63 @@
+"""
+Bytes on the wire for each response variant of a sample window, compared with
+the original unminified, uncompressed svg.
+
+    python -m benchmarks.report_sizes
+"""
+
+from datetime import datetime
+import gzip
+
+from window.compression import SUPPORTED_ENCODINGS
+from window.icons import SVGS_DIR
+from window.render import render_window
+from window.template import WINDOW_SVG_SOURCE
+
+ICON = "10d"
+WEATHER_DATA = {
+    "coord": {"lat": 40.7128, "lon": -74.006},
+    "name": "New York",
+    "main": {"temp": 21.5},
+    "weather": [{"icon": ICON, "description": "light rain"}],
+    "sys": {
+        "sunrise": datetime.now().replace(hour=6).timestamp(),
+        "sunset": datetime.now().replace(hour=19).timestamp(),
+    },
+}
+
+
+def render_original():
+    gradient_color = "rgb(255, 183, 116)"
+    return WINDOW_SVG_SOURCE.format(
+        start_color=gradient_color,
+        end_color=gradient_color,
+        start_color_animation="",
+        end_color_animation="",
+        text_color="black",
+        location=WEATHER_DATA["name"],
+        currently="21.5°C, light rain",
+        celestial_body_svg=(SVGS_DIR / "sun.svg").read_text(),
+        weather_icon_svg=(SVGS_DIR / f"weather-{ICON[:-1]}.svg").read_text(),
+    ).encode()
+
+
+def main():
+    original = render_original()
+    window = render_window(WEATHER_DATA, "metric")
+
+    variants = [
+        ("original", original),
+        ("original gzip", gzip.compress(original)),
+        ("minified", window.svg),
+    ] + [
+        (f"minified {encoding}", window.encode(encoding))
+        for encoding in SUPPORTED_ENCODINGS
+    ]
+
+    for name, body in variants:
+        saved = 1 - len(body) / len(original)
+        print(f"{name:<16} {len(body):>7} bytes  {saved:>6.1%} saved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+A local stand-in for the OpenWeather `/data/2.5/weather` and
+`/data/2.5/forecast` endpoints, so the service can be exercised with no
+network and no API key.
+
+    python -m benchmarks.stub_server --port 8001 --latency 80 --error-rate 0.01
+    OPEN_WEATHER_BASE_URL=http://127.0.0.1:8001/data/2.5 uvicorn main:app
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from urllib.parse import parse_qs
+
+import uvicorn
+
+from .common import make_forecast_data, make_weather_data
+
+PAYLOADS = {
+    "/data/2.5/weather": make_weather_data,
+    "/data/2.5/forecast": make_forecast_data,
+}
+
+
+class StubWeatherApp:
+    def __init__(
+        self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.requests = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        self.requests += 1
+        query = parse_qs(scope["query_string"].decode())
+
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        make_payload = PAYLOADS.get(scope["path"].rstrip("/"))
+        if make_payload is None:
+            status, body = 404, {"cod": "404", "message": "Internal error"}
+        elif random.random() < self.error_rate:
+            status, body = random.choice(
+                [
+                    (429, {"cod": 429, "message": "Your account is temporary blocked"}),
+                    (500, {"cod": "500", "message": "Internal error"}),
+                ]
+            )
+        else:
+            try:
+                lat = float(query["lat"][0])
+                lon = float(query["lon"][0])
+            except (KeyError, ValueError):
+                status, body = 400, {"cod": "400", "message": "wrong latitude"}
+            else:
+                units = query.get("units", ["standard"])[0]
+                status, body = 200, make_payload(lat, lon, units)
+
+        payload = json.dumps(body).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json; charset=utf-8"),
+                    (b"content-length", str(len(payload)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": payload})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=80, help="milliseconds")
+    parser.add_argument("--jitter", type=float, default=20, help="milliseconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    app = StubWeatherApp(args.latency / 1000, args.jitter / 1000, args.error_rate)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,56 @@
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
+import asyncio
+from contextlib import asynccontextmanager
+from enum import Enum
+from pathlib import Path
 
-from window import create_window_svg
-from window.constants import DEFAULT_LANG, DEFAULT_LOCATION, DEFAULT_UNITS
+from fastapi import FastAPI, Header, HTTPException, Query, Response
+from fastapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    PlainTextResponse,
+    StreamingResponse,
+)
+from pydantic import BaseModel, Field
+
+from window import create_admitted_window
+from window.admission import Overloaded
+from window.batch import create_windows
+from window.compression import STREAM_ENCODINGS, select_encoding
+from window.constants import (
+    ADMISSION_RETRY_AFTER,
+    BATCH_MAX_LOCATIONS,
+    CACHE_MAX_AGE,
+    DEFAULT_LANG,
+    DEFAULT_LOCATION,
+    DEFAULT_UNITS,
+    FORECAST_MAX_FRAMES,
+    FORECAST_MAX_HOURS,
+    LOCATION_GRID,
+    LOCATION_SNAP_RADIUS,
+)
+from window.forecast import create_forecast, format_frames, render_timeline_svg
+from window.live import live_hub
+from window.locations import get_location_report, resolve_location
+from window.metrics import ServerTimingMiddleware, render_metrics, timed
+from window.stream import get_stream_max_age, stream_window
 from window.types import LangEnum, UnitEnum
+from window.warmup import readiness, warm_up
+from window.weather import get_weather_cache_key, prefetch_scheduler, weather_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await weather_client.start()
+    prefetch_scheduler.start()
+    # In the background, so the process is up (and /ready answers) while
+    # it warms
+    warmup = asyncio.create_task(warm_up())
+    yield
+    warmup.cancel()
+    live_hub.close()
+    await prefetch_scheduler.stop()
+    await weather_client.close()
+
 
 app = FastAPI(
     title="Live Window API",
@@ -18,36 +65,254 @@ app = FastAPI(
     },
     docs_url=None,
     redoc_url=None,
+    lifespan=lifespan,
 )
+app.add_middleware(ServerTimingMiddleware)
+
+LIVE_JS = (Path(__file__).parent / "window" / "static" / "live.js").read_bytes()
+
+
+def get_location(location: str):
+    try:
+        return resolve_location(location)
+    except ValueError:
+        raise HTTPException(
+            status_code=422,
+            detail="location must be lat,lng within -90..90 and -180..180",
+        )
 
 
 @app.get("/api/")
-def generate_image(
+async def generate_image(
     units: UnitEnum = DEFAULT_UNITS,
     location: str = f"{DEFAULT_LOCATION['lat']},{DEFAULT_LOCATION['lng']}",
     lang: LangEnum = DEFAULT_LANG,
-) -> HTMLResponse:
-    lat_str, lon_str = location.split(",")
+    stream: bool = False,
+    if_none_match: str | None = Header(default=None),
+    accept_encoding: str | None = Header(default=None),
+) -> Response:
+    lat, lon = get_location(location)
+    if stream:
+        return stream_image(units, lat, lon, lang, accept_encoding)
 
-    lat = float(lat_str) if lat_str else None
-    lon = float(lon_str) if lon_str else None
+    try:
+        window = await create_admitted_window(units, lat, lon, lang)
+    except Overloaded:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many requests in flight, try again shortly",
+            headers={"Retry-After": str(ADMISSION_RETRY_AFTER)},
+        )
 
-    if lat is None or lon is None:
-        lat, lon = DEFAULT_LOCATION["lat"], DEFAULT_LOCATION["lng"]
+    encoding = select_encoding(accept_encoding)
+    headers = {
+        "ETag": window.encoded_etag(encoding),
+        "Cache-Control": f"public, max-age={window.max_age()}",
+        "Vary": "Accept-Encoding",
+    }
 
-    svg = create_window_svg(units, lat, lon, lang)
-    return HTMLResponse(
-        content=svg,
+    if is_etag_match(if_none_match, window.etag):
+        return Response(status_code=304, headers=headers)
+
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+
+    with timed("encode"):
+        content = window.encode(encoding)
+
+    return Response(
+        content=content,
         status_code=200,
         media_type="image/svg+xml",
+        headers=headers,
+    )
+
+
+def stream_image(
+    units: UnitEnum,
+    lat: float,
+    lon: float,
+    lang: LangEnum,
+    accept_encoding: str | None,
+):
+    # The frame goes out before the weather is fetched, so there's no ETag
+    # and only a short max-age; brotli can't be streamed chunk by chunk
+    encoding = select_encoding(accept_encoding, tuple(STREAM_ENCODINGS))
+    headers = {
+        "Cache-Control": f"public, max-age={get_stream_max_age()}",
+        "Vary": "Accept-Encoding",
+    }
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+
+    return StreamingResponse(
+        stream_window(units, lat, lon, lang, encoding),
+        media_type="image/svg+xml",
+        headers=headers,
+    )
+
+
+class ForecastFormat(str, Enum):
+    svg = "svg"
+    json = "json"
+
+
+@app.get("/api/forecast/")
+async def generate_forecast(
+    units: UnitEnum = DEFAULT_UNITS,
+    location: str = f"{DEFAULT_LOCATION['lat']},{DEFAULT_LOCATION['lng']}",
+    lang: LangEnum = DEFAULT_LANG,
+    hours: int = Query(default=12, ge=1, le=FORECAST_MAX_HOURS),
+    step: int = Query(default=60, ge=5, le=180, description="Minutes per frame"),
+    format: ForecastFormat = ForecastFormat.svg,
+) -> Response:
+    """
+    The window for the next `hours`, one frame every `step` minutes: as an
+    svg that animates through them in real time, or as a list of frames.
+    """
+    frame_count = hours * 60 // step
+    if not 1 <= frame_count <= FORECAST_MAX_FRAMES:
+        raise HTTPException(
+            status_code=422,
+            detail=f"hours and step must give 1 to {FORECAST_MAX_FRAMES} frames",
+        )
+
+    lat, lon = get_location(location)
+    name, frames = await create_forecast(units, lat, lon, lang, hours, step)
+    # The animation starts when loaded, so a cached copy drifts by its age
+    headers = {"Cache-Control": f"public, max-age={min(step * 60, CACHE_MAX_AGE)}"}
+
+    if format == ForecastFormat.json:
+        return JSONResponse(
+            {
+                "location": name,
+                "units": units,
+                "step": step,
+                "frames": format_frames(frames),
+            },
+            headers=headers,
+        )
+
+    with timed("svg"):
+        content = render_timeline_svg(frames, name, step)
+    return Response(content, media_type="image/svg+xml", headers=headers)
+
+
+@app.get("/api/live/")
+async def live_image(
+    units: UnitEnum = DEFAULT_UNITS,
+    location: str = f"{DEFAULT_LOCATION['lat']},{DEFAULT_LOCATION['lng']}",
+    lang: LangEnum = DEFAULT_LANG,
+) -> StreamingResponse:
+    """
+    Server-sent events: a `window` event with the full svg, then `delta`
+    events with only the values that changed. See /live.js for a client.
+    """
+    lat, lon = get_location(location)
+    key = get_weather_cache_key(units, lat, lon, lang)
+    return StreamingResponse(
+        live_hub.subscribe(key),
+        media_type="text/event-stream",
         headers={
-            "Content-Type": "image/svg+xml",
-            "Cache-Control": "no-cache, max-age=0",
-            "Expires": "Thu, 01 Jan 1970 00:00:00 GMT",
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            # live.js opens the stream from whatever page embeds it
+            "Access-Control-Allow-Origin": "*",
         },
     )
 
 
+@app.get("/live.js", include_in_schema=False)
+def live_js():
+    return Response(
+        LIVE_JS,
+        media_type="text/javascript",
+        headers={"Cache-Control": "public, max-age=3600"},
+    )
+
+
+class BatchRequest(BaseModel):
+    locations: list[str] = Field(min_length=1, max_length=BATCH_MAX_LOCATIONS)
+    units: UnitEnum = DEFAULT_UNITS
+    lang: LangEnum = DEFAULT_LANG
+
+
+@app.post("/api/batch/")
+async def generate_images(batch: BatchRequest) -> dict:
+    locations = {}
+    for location in batch.locations:
+        try:
+            locations[location] = resolve_location(location)
+        except ValueError:
+            locations[location] = None
+
+    results = await create_windows(
+        [lat_lon for lat_lon in locations.values() if lat_lon is not None],
+        batch.units,
+        batch.lang,
+    )
+
+    windows = {}
+    for location, lat_lon in locations.items():
+        result = results.get(lat_lon)
+        if lat_lon is None:
+            windows[location] = {"error": f"Invalid location: {location!r}"}
+        elif isinstance(result, Exception):
+            windows[location] = {"error": str(result) or type(result).__name__}
+        else:
+            windows[location] = {
+                "svg": result.svg.decode(),
+                "etag": result.etag,
+                "max_age": result.max_age(),
+            }
+            if result.fallback:
+                # Upstream failed, so this is the last good weather or just the sky
+                windows[location]["fallback"] = True
+
+    return {"units": batch.units, "lang": batch.lang, "windows": windows}
+
+
+@app.get("/api/locations/")
+def get_locations(limit: int = Query(default=100, ge=1)) -> dict:
+    """
+    How many distinct requested coordinates collapsed onto each canonical
+    location (and so share its cache entries).
+    """
+    return {
+        "grid": LOCATION_GRID,
+        "snap_radius": LOCATION_SNAP_RADIUS,
+        "locations": get_location_report(limit),
+    }
+
+
+def is_etag_match(if_none_match: str | None, etag: str):
+    if not if_none_match:
+        return False
+
+    # Weak comparison, any content-coding of the same window matches
+    digest = etag.strip('"')
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip().removeprefix("W/").strip('"')
+        if candidate == "*" or candidate.split("-")[0] == digest:
+            return True
+
+    return False
+
+
+@app.get("/ready", include_in_schema=False)
+def ready():
+    return JSONResponse(
+        content=readiness.report(), status_code=200 if readiness.ready else 503
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return PlainTextResponse(
+        render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @app.get("/", include_in_schema=False)
 def index():
     return HTMLResponse(
@@ -0,0 +1,286 @@
+"""
+Pre-renders windows into a directory that can be synced to a static host.
+
+    python publish.py locations.txt --units metric imperial --lang en fr --out dist
+
+`locations.txt` has one `lat,lng` per line (blank lines and `#` comments are
+skipped); every location is rendered in every unit and language. The weather
+is fetched with bounded concurrency and the windows rendered across a process
+pool. Each svg is written once under its content hash, and `manifest.json`
+maps every location, units and language to its file.
+
+With `--incremental`, windows whose weather and sky colours are the same as in
+the previous manifest keep their file and aren't rendered again.
+
+OpenWeather calls are paced to `--rate` per minute (`WEATHER_RATE_LIMIT` by
+default), each waiting its turn rather than failing, so set it to what the
+account's quota leaves over from the API.
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from hashlib import blake2b
+import json
+import logging
+import os
+from pathlib import Path
+import time
+
+from window.constants import BATCH_CONCURRENCY, WEATHER_RATE_BURST, WEATHER_RATE_LIMIT
+from window.locations import resolve_location
+from window.render import format_rgb, get_window_gradient, render_window
+from window.resilience import TokenBucket
+from window.types import LangEnum, UnitEnum
+from window.weather import get_weather_data, weather_client
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+
+def read_locations(path: Path):
+    locations = []
+    for line in path.read_text().splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            locations.append(resolve_location(line))
+    # Locations that normalise to the same point are only rendered once
+    return list(dict.fromkeys(locations))
+
+
+def get_entry_name(units: str, lat: float, lon: float, lang: str):
+    return f"{lat},{lon}/{units}/{lang}"
+
+
+def get_weather_hash(weather_data: dict):
+    payload = json.dumps(weather_data, sort_keys=True, separators=(",", ":"))
+    return blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def get_color_bucket(weather_data: dict, now: datetime):
+    # The colours themselves rather than the minute, so a sky that hasn't
+    # changed since the last run doesn't count as a change
+    gradient = get_window_gradient(weather_data, now)
+    return f"{format_rgb(gradient['start'])}-{format_rgb(gradient['end'])}"
+
+
+def render_job(weather_data: dict, units: str, now: datetime):
+    # Runs in a worker process, so only the bytes go back
+    window = render_window(weather_data, units, now)
+    return window.svg, window.etag, window.expires_at.isoformat()
+
+
+def write_svg(out_dir: Path, svg: bytes):
+    name = f"{blake2b(svg, digest_size=16).hexdigest()}.svg"
+    path = out_dir / name
+    if not path.exists():
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(svg)
+        os.replace(tmp_path, path)
+    return name
+
+
+def load_manifest(out_dir: Path):
+    try:
+        return json.loads((out_dir / MANIFEST_NAME).read_text())
+    except FileNotFoundError:
+        return {"windows": {}}
+
+
+def write_manifest(out_dir: Path, manifest: dict):
+    tmp_path = out_dir / f"{MANIFEST_NAME}.tmp"
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp_path, out_dir / MANIFEST_NAME)
+
+
+async def publish(
+    locations: list[tuple[float, float]],
+    units: list[str],
+    langs: list[str],
+    out_dir: Path,
+    incremental: bool = False,
+    concurrency: int = BATCH_CONCURRENCY,
+    processes: int | None = None,
+    timeout: float = 30,
+    rate: float = WEATHER_RATE_LIMIT,
+):
+    out_dir.mkdir(parents=True, exist_ok=True)
+    previous = load_manifest(out_dir)["windows"] if incremental else {}
+    # One clock for the whole run, so every window shows the same moment
+    now = datetime.now(timezone.utc)
+
+    windows = {}
+    counts = {"rendered": 0, "skipped": 0, "failed": 0}
+    timings = {"weather": 0.0, "render": 0.0}
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+    # Calls queue up for the rate limit instead of falling back. At most
+    # `concurrency` are waiting, so none waits longer than this for its turn
+    weather_client.limiter = TokenBucket(rate / 60, WEATHER_RATE_BURST)
+    weather_client.pace = True
+    latency_budget = timeout + concurrency * 60 / rate
+
+    async def create(pool: ProcessPoolExecutor, job: tuple):
+        name = get_entry_name(*job)
+        async with semaphore:
+            started = time.perf_counter()
+            weather_data = await get_weather_data(*job, latency_budget=latency_budget)
+            timings["weather"] += time.perf_counter() - started
+
+        if weather_data.get("fallback"):
+            # Don't publish placeholder skies, keep what's there
+            logger.warning("No weather for %s", name)
+            counts["failed"] += 1
+            if name in previous:
+                windows[name] = previous[name]
+            return
+
+        units_value = job[0]
+        inputs = {
+            "weather_hash": get_weather_hash(weather_data),
+            "color_bucket": get_color_bucket(weather_data, now),
+        }
+        entry = previous.get(name)
+        if (
+            entry is not None
+            and all(entry.get(field) == value for field, value in inputs.items())
+            and (out_dir / entry["file"]).exists()
+        ):
+            windows[name] = entry
+            counts["skipped"] += 1
+            return
+
+        started = time.perf_counter()
+        try:
+            svg, etag, expires_at = await loop.run_in_executor(
+                pool, render_job, weather_data, units_value, now
+            )
+        except Exception:
+            logger.warning("Failed to render %s", name, exc_info=True)
+            counts["failed"] += 1
+            if entry is not None:
+                windows[name] = entry
+            return
+        timings["render"] += time.perf_counter() - started
+
+        windows[name] = {
+            "file": write_svg(out_dir, svg),
+            "etag": etag,
+            "expires_at": expires_at,
+            **inputs,
+        }
+        counts["rendered"] += 1
+
+    jobs = [
+        (unit, lat, lon, lang)
+        for lat, lon in locations
+        for unit in units
+        for lang in langs
+    ]
+
+    started = time.perf_counter()
+    await weather_client.start()
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            await asyncio.gather(*(create(pool, job) for job in jobs))
+    finally:
+        await weather_client.close()
+    elapsed = time.perf_counter() - started
+
+    write_manifest(
+        out_dir,
+        {"generated_at": now.isoformat(), "windows": dict(sorted(windows.items()))},
+    )
+    return {
+        "windows": len(jobs),
+        **counts,
+        "elapsed": elapsed,
+        "weather_time": timings["weather"],
+        "render_time": timings["render"],
+    }
+
+
+def print_summary(summary: dict):
+    elapsed = summary["elapsed"]
+    print(
+        f"{summary['windows']} windows in {elapsed:.2f}s "
+        f"({summary['windows'] / max(elapsed, 1e-9):.1f}/s): "
+        f"{summary['rendered']} rendered, {summary['skipped']} unchanged, "
+        f"{summary['failed']} failed"
+    )
+    if summary["windows"]:
+        print(
+            f"  weather: {summary['weather_time'] / summary['windows'] * 1000:.1f}ms "
+            "per location"
+        )
+    if summary["rendered"]:
+        # Wall time, including the round trip to the pool
+        print(
+            f"  render: {summary['render_time'] / summary['rendered'] * 1000:.1f}ms "
+            "per window"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("locations", type=Path, help="file of lat,lng lines")
+    parser.add_argument(
+        "--units",
+        nargs="+",
+        default=[UnitEnum.metric.value],
+        choices=[unit.value for unit in UnitEnum],
+    )
+    parser.add_argument(
+        "--lang",
+        nargs="+",
+        default=[LangEnum.en.value],
+        choices=[lang.value for lang in LangEnum],
+    )
+    parser.add_argument("--out", type=Path, default=Path("dist"))
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="skip windows whose weather and colours haven't changed",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=BATCH_CONCURRENCY,
+        help="weather requests in flight",
+    )
+    parser.add_argument("--processes", type=int, default=None, help="render workers")
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30,
+        help="seconds to wait for each weather, on top of its turn under --rate",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=WEATHER_RATE_LIMIT,
+        help="OpenWeather calls per minute",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    summary = asyncio.run(
+        publish(
+            read_locations(args.locations),
+            args.units,
+            args.lang,
+            args.out,
+            incremental=args.incremental,
+            concurrency=args.concurrency,
+            processes=args.processes,
+            timeout=args.timeout,
+            rate=args.rate,
+        )
+    )
+    print_summary(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,4 +2,4 @@
 # exit on error
 set -o errexit
 
-poetry install --no-root
+poetry install --no-root --extras brotli
@@ -0,0 +1,108 @@
+import asyncio
+from collections import deque
+
+import pytest
+
+from window.admission import AdmissionController, DeadlineExceeded, QueueFull
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_admits_up_to_max_in_flight():
+    async def main():
+        controller = AdmissionController(max_in_flight=2, max_queue=0)
+        await controller.acquire()
+        await controller.acquire()
+        with pytest.raises(QueueFull):
+            await controller.acquire()
+
+        controller.release()
+        await controller.acquire()
+        return controller.stats()
+
+    stats = run(main())
+    assert stats["in_flight"] == 2
+    assert stats["admitted"] == 3
+    assert stats["queue_full"] == 1
+
+
+def test_queued_requests_are_admitted_in_order():
+    async def main():
+        controller = AdmissionController(max_in_flight=1, max_queue=2)
+        order = []
+
+        async def request(name: str):
+            async with controller.admit(timeout=1):
+                order.append(name)
+                await asyncio.sleep(0)
+
+        await asyncio.gather(request("a"), request("b"), request("c"))
+        return order, controller.stats()
+
+    order, stats = run(main())
+    assert order == ["a", "b", "c"]
+    assert stats["in_flight"] == 0
+    assert stats["queued"] == 0
+
+
+def test_deadline_exceeded_while_queued():
+    async def main():
+        controller = AdmissionController(max_in_flight=1, max_queue=1)
+        await controller.acquire()
+        with pytest.raises(DeadlineExceeded):
+            await controller.acquire(timeout=0.01)
+        return controller.stats()
+
+    stats = run(main())
+    assert stats["deadline_exceeded"] == 1
+    assert stats["queued"] == 0
+    assert stats["in_flight"] == 1
+
+
+def test_timeout_racing_release_sheds_cleanly():
+    # A slot is released in the same loop iteration the deadline passes:
+    # release() pops the waiter its timeout just cancelled, before the queued
+    # request resumes to clean up after itself
+    class RacingWaiters(deque):
+        def append(self, waiter: asyncio.Future):
+            waiter.add_done_callback(
+                lambda waiter: waiter.cancelled() and controller.release()
+            )
+            super().append(waiter)
+
+    controller = AdmissionController(max_in_flight=1, max_queue=1)
+    controller._waiters = RacingWaiters()
+
+    async def main():
+        await controller.acquire()
+        with pytest.raises(DeadlineExceeded):
+            await controller.acquire(timeout=0.01)
+
+        # The slot freed up by the release is usable straight away
+        await controller.acquire(timeout=0)
+        return controller.stats()
+
+    stats = run(main())
+    assert stats["deadline_exceeded"] == 1
+    assert stats["queued"] == 0
+    assert stats["in_flight"] == 1
+
+
+def test_cancelled_while_queued_gives_up_its_place():
+    async def main():
+        controller = AdmissionController(max_in_flight=1, max_queue=1)
+        await controller.acquire()
+        waiting = asyncio.create_task(controller.acquire(timeout=1))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+        controller.release()
+        return controller.stats()
+
+    stats = run(main())
+    assert stats["in_flight"] == 0
+    assert stats["queued"] == 0
@@ -0,0 +1,22 @@
+import json
+
+from window.backends import MemoryBackend, SQLiteBackend, TieredBackend, dump_json
+from window.cache import TTLCache
+
+
+def test_tiered_backend_counts_rows_pruned_from_the_shared_backend(tmp_path):
+    shared = SQLiteBackend(
+        str(tmp_path / "cache.sqlite3"), "test", 10, dump_json, json.loads
+    )
+    shared.PRUNE_EVERY = 5
+    cache = TTLCache(
+        ttl=600, maxsize=10, backend=TieredBackend(MemoryBackend(100), shared)
+    )
+
+    for key in range(15):
+        cache.set(key, key)
+
+    assert len(cache) == 10
+    assert cache.stats()["evictions"] == 5
+    assert shared.get(0) is None
+    assert shared.get(14)[1] == 14
@@ -0,0 +1,30 @@
+import httpx
+from fastapi.testclient import TestClient
+
+from main import app
+from window import weather as weather_module
+from window.cache import TTLCache
+
+
+def test_batch_marks_windows_rendered_from_fallback_weather(monkeypatch):
+    async def fetch(units, lat, lon, lang):
+        if lat < 0:
+            raise httpx.ConnectError("upstream down")
+        return {
+            "coord": {"lat": lat, "lon": lon},
+            "name": "Somewhere",
+            "main": {"temp": 21.5},
+            "weather": [{"icon": "10d", "description": "light rain"}],
+        }
+
+    monkeypatch.setattr(weather_module.weather_client, "fetch", fetch)
+    for name in ("weather_cache", "last_good_weather"):
+        monkeypatch.setattr(weather_module, name, TTLCache(ttl=600, maxsize=10))
+
+    response = TestClient(app).post(
+        "/api/batch/", json={"locations": ["12.34,56.78", "-12.34,56.78"]}
+    )
+    windows = response.json()["windows"]
+    assert "fallback" not in windows["12.34,56.78"]
+    assert windows["-12.34,56.78"]["fallback"] is True
+    assert windows["-12.34,56.78"]["svg"].startswith("<svg")
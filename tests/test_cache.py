@@ -0,0 +1,181 @@
+import asyncio
+import threading
+
+import pytest
+
+from window import cache as cache_module
+from window.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module, "time", clock)
+    return clock
+
+
+def test_get_and_set_expire_after_ttl(clock):
+    cache = TTLCache(ttl=10, maxsize=10)
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+    clock.now += 10
+    assert cache.get("key") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_is_evicted(clock):
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_get_or_load_coalesces_concurrent_threads(clock):
+    cache = TTLCache(ttl=10, maxsize=10)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "value"
+
+    results = []
+    leader = threading.Thread(
+        target=lambda: results.append(cache.get_or_load("key", loader))
+    )
+    leader.start()
+    started.wait(5)
+
+    followers = [
+        threading.Thread(
+            target=lambda: results.append(cache.get_or_load("key", loader))
+        )
+        for _ in range(4)
+    ]
+    for thread in followers:
+        thread.start()
+    # Followers are parked on the leader's future by now
+    while cache.stats()["coalesced"] < 4:
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert calls == [1]
+    assert results == ["value"] * 5
+    assert cache.get("key") == "value"
+
+
+def test_get_or_load_async_coalesces_concurrent_requests(clock):
+    cache = TTLCache(ttl=10, maxsize=10)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def main():
+        return await asyncio.gather(
+            *(cache.get_or_load_async("key", loader) for _ in range(10))
+        )
+
+    assert asyncio.run(main()) == ["value"] * 10
+    assert calls == [1]
+    assert cache.stats()["coalesced"] == 9
+
+
+def test_failed_load_reaches_every_waiter_and_is_not_cached(clock):
+    cache = TTLCache(ttl=10, maxsize=10)
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    async def working():
+        return "value"
+
+    async def main():
+        results = await asyncio.gather(
+            *(cache.get_or_load_async("key", failing) for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+        return await cache.get_or_load_async("key", working)
+
+    assert asyncio.run(main()) == "value"
+    assert calls == [1]
+
+
+def test_stale_entry_is_served_while_it_revalidates(clock):
+    cache = TTLCache(ttl=10, maxsize=10, stale_ttl=30)
+    versions = iter(["fresh", "refreshed"])
+
+    async def loader():
+        await asyncio.sleep(0)
+        return next(versions)
+
+    async def main():
+        assert await cache.get_or_load_async("key", loader) == "fresh"
+
+        clock.now += 15
+        # Expired but within stale_ttl: served straight away...
+        assert await cache.get_or_load_async("key", loader) == "fresh"
+        # ...while a single refresh runs in the background
+        assert await cache.get_or_load_async("key", loader) == "fresh"
+        await asyncio.gather(*cache._background)
+        return await cache.get_or_load_async("key", loader)
+
+    assert asyncio.run(main()) == "refreshed"
+    stats = cache.stats()
+    assert stats["stale_hits"] == 2
+    assert stats["refreshes"] == 1
+
+
+def test_failed_revalidation_keeps_serving_stale(clock):
+    cache = TTLCache(ttl=10, maxsize=10, stale_ttl=30)
+    cache.set("key", "stale")
+    clock.now += 15
+
+    async def failing():
+        raise RuntimeError("upstream down")
+
+    async def main():
+        assert await cache.get_or_load_async("key", failing) == "stale"
+        await asyncio.gather(*cache._background)
+        return await cache.get_or_load_async("key", failing)
+
+    assert asyncio.run(main()) == "stale"
+
+
+def test_entry_past_stale_ttl_is_loaded_again(clock):
+    cache = TTLCache(ttl=10, maxsize=10, stale_ttl=30)
+    cache.set("key", "old")
+    clock.now += 40
+
+    async def loader():
+        return "new"
+
+    assert asyncio.run(cache.get_or_load_async("key", loader)) == "new"
+    assert cache.stats()["stale_hits"] == 0
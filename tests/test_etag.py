@@ -0,0 +1,36 @@
+import pytest
+
+from main import is_etag_match
+
+ETAG = '"c12fe06ac3ec04ab11b998e1260da1b0"'
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [
+        ETAG,
+        f"W/{ETAG}",
+        # The same window in another content-coding
+        '"c12fe06ac3ec04ab11b998e1260da1b0-gzip"',
+        '"c12fe06ac3ec04ab11b998e1260da1b0-br"',
+        f'"0123", {ETAG}',
+        f' "0123" ,W/{ETAG} ',
+        "*",
+    ],
+)
+def test_matches(if_none_match: str):
+    assert is_etag_match(if_none_match, ETAG)
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [
+        None,
+        "",
+        '"0123456789abcdef0123456789abcdef"',
+        '"c12fe06ac3ec04ab11b998e1260da1b"',
+        '"0123", "4567-gzip"',
+    ],
+)
+def test_does_not_match(if_none_match: str | None):
+    assert not is_etag_match(if_none_match, ETAG)
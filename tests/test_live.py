@@ -0,0 +1,46 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from main import app
+from window import live as live_module
+from window.live import LiveHub
+
+KEY = ("metric", 40.71, -74.01, "en")
+
+
+async def failing_create_window(*args):
+    raise RuntimeError("upstream down")
+
+
+async def collect(events, timeout: float = 1):
+    async def read():
+        return [event async for event in events]
+
+    return await asyncio.wait_for(read(), timeout)
+
+
+def test_failed_first_tick_ends_the_stream(monkeypatch):
+    monkeypatch.setattr(live_module, "create_window", failing_create_window)
+
+    async def main():
+        hub = LiveHub()
+        events = await collect(hub.subscribe(KEY))
+        # The channel goes away with its last subscriber
+        assert hub.channels == {}
+        return events
+
+    events = asyncio.run(main())
+    assert len(events) == 1
+    assert events[0].startswith(b"event: error\n")
+
+
+def test_live_stream_allows_any_origin(monkeypatch):
+    monkeypatch.setattr(live_module, "create_window", failing_create_window)
+
+    response = TestClient(app).get(
+        "/api/live/", headers={"Origin": "https://example.com"}
+    )
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert response.headers["content-type"].startswith("text/event-stream")
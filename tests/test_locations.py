@@ -0,0 +1,57 @@
+import pytest
+
+from window.constants import DEFAULT_LOCATION
+from window.locations import parse_location, quantise_location
+
+
+def test_parse_location():
+    assert parse_location("40.7128,-74.0060") == (40.7128, -74.006)
+    assert parse_location(" 10.5 , -61.5 ") == (10.5, -61.5)
+
+
+def test_parse_location_defaults_missing_parts():
+    default = (DEFAULT_LOCATION["lat"], DEFAULT_LOCATION["lng"])
+    assert parse_location(",") == default
+    assert parse_location("12.5,") == default
+
+
+@pytest.mark.parametrize(
+    "location",
+    [
+        "inf,0",
+        "0,-inf",
+        "nan,0",
+        "90.5,0",
+        "-91,0",
+        "0,180.01",
+        "0,-181",
+        "abc,0",
+        "1,2,3",
+        "1",
+    ],
+)
+def test_parse_location_rejects_invalid(location: str):
+    with pytest.raises(ValueError):
+        parse_location(location)
+
+
+def test_parse_location_accepts_the_edges():
+    assert parse_location("90,180") == (90, 180)
+    assert parse_location("-90,-180") == (-90, -180)
+
+
+def test_quantise_location():
+    assert quantise_location(40.7128, -74.006, 0.01) == (40.71, -74.01)
+    # No float noise left over from the multiplication
+    assert quantise_location(40.71, 2.3522, 0.01) == (40.71, 2.35)
+    assert quantise_location(-0.004, 0.004, 0.01) == (0, 0)
+
+
+def test_quantise_location_disabled():
+    assert quantise_location(40.7128, -74.006, 0) == (40.7128, -74.006)
+
+
+def test_nearby_locations_share_a_grid_point():
+    assert quantise_location(48.8566, 2.3522, 0.01) == quantise_location(
+        48.8591, 2.3478, 0.01
+    )
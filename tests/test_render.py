@@ -0,0 +1,26 @@
+import marshal
+
+from window.render import dump_rendered_window, load_rendered_window, render_window
+
+WEATHER_DATA = {
+    "coord": {"lat": 40.71, "lon": -74.01},
+    "name": "New York",
+    "main": {"temp": 21.5},
+    "weather": [{"icon": "10d", "description": "light rain"}],
+}
+
+
+def test_rendered_window_round_trips():
+    for weather_data in (WEATHER_DATA, {**WEATHER_DATA, "fallback": True}):
+        window = render_window(weather_data)
+        loaded = load_rendered_window(dump_rendered_window(window))
+        assert loaded.svg == window.svg
+        assert loaded.etag == window.etag
+        assert loaded.expires_at == window.expires_at
+        assert loaded.fallback == bool(weather_data.get("fallback"))
+
+
+def test_rows_stored_without_fallback_still_load():
+    window = render_window(WEATHER_DATA)
+    data = marshal.dumps((window.chunks, window.etag, window.expires_at.timestamp()))
+    assert load_rendered_window(data).fallback is False
@@ -0,0 +1,82 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from window.colors import getRealisticColorGradient
+from window.sky import get_sky_gradient
+from window.solar import get_local_sun_times, get_utc_offset
+
+LOCATIONS = {
+    "equator": (0.0, 0.0),
+    "quito": (-0.1807, -78.4678),
+    "new-york": (40.7128, -74.006),
+    "ushuaia": (-54.8019, -68.303),
+    "tromso": (69.6492, 18.9553),
+    "svalbard": (78.2232, 15.6267),
+}
+DAYS = [
+    date(2024, 3, 20),
+    # Midnight sun in the north, polar night in the far south, and vice versa
+    date(2024, 6, 21),
+    date(2024, 12, 21),
+]
+
+
+def get_minutes(day: date):
+    midnight = datetime.combine(day, datetime.min.time())
+    return [midnight + timedelta(minutes=minute) for minute in range(24 * 60)]
+
+
+@pytest.mark.parametrize("day", DAYS, ids=str)
+@pytest.mark.parametrize("location", LOCATIONS.values(), ids=LOCATIONS.keys())
+def test_sky_table_matches_realistic_color_gradient(location, day):
+    lat, lon = location
+    sunrise_time, sunset_time = get_local_sun_times(lat, lon, get_utc_offset(lon), day)
+
+    for now in get_minutes(day):
+        assert get_sky_gradient(
+            sunrise_time, sunset_time, now
+        ) == getRealisticColorGradient(sunrise_time, sunset_time, now), now
+
+
+@pytest.mark.parametrize(
+    "sunrise, sunset",
+    [
+        # Sunrise and sunset with seconds, and at the very ends of the day
+        (timedelta(hours=6, minutes=2, seconds=17), timedelta(hours=18, minutes=11)),
+        (timedelta(hours=8, minutes=48, seconds=51), timedelta(hours=15, minutes=53)),
+        (timedelta(minutes=30), timedelta(hours=23, minutes=50, seconds=9)),
+        (timedelta(0), timedelta(hours=23, minutes=59, seconds=59)),
+    ],
+)
+def test_sky_table_matches_for_edge_sun_times(sunrise, sunset):
+    day = date(2024, 3, 20)
+    midnight = datetime.combine(day, datetime.min.time())
+    sunrise_time, sunset_time = midnight + sunrise, midnight + sunset
+
+    for now in get_minutes(day):
+        assert get_sky_gradient(
+            sunrise_time, sunset_time, now
+        ) == getRealisticColorGradient(sunrise_time, sunset_time, now), now
+
+
+@pytest.mark.parametrize(
+    "lat, lon, timezone",
+    [
+        # Apia and Kiritimati keep the clock a day ahead of their longitude
+        (-13.8333, -171.7667, 13 * 3600),
+        (1.8721, -157.4278, 14 * 3600),
+        (40.7128, -74.006, -4 * 3600),
+        (-46.4132, 168.3538, 12 * 3600),
+    ],
+)
+def test_sun_times_fall_on_the_local_day(lat, lon, timezone):
+    day = date(2024, 6, 21)
+    weather_data = {"coord": {"lat": lat, "lon": lon}, "timezone": timezone}
+    utc_offset = get_utc_offset(lon, weather_data)
+    sunrise_time, sunset_time = get_local_sun_times(lat, lon, utc_offset, day)
+
+    assert sunrise_time.date() == day
+    assert sunset_time.date() == day
+    noon = datetime.combine(day, datetime.min.time()) + timedelta(hours=12)
+    assert sunrise_time < noon < sunset_time
@@ -0,0 +1,53 @@
+from fastapi.testclient import TestClient
+
+import window
+from main import app
+from window import weather as weather_module
+from window.admission import AdmissionController
+from window.cache import TTLCache
+
+WEATHER_DATA = {
+    "coord": {"lat": 12.34, "lon": 56.78},
+    "name": "Somewhere",
+    "main": {"temp": 21.5},
+    "weather": [{"icon": "10d", "description": "light rain"}],
+}
+
+
+def stream(monkeypatch, controller: AdmissionController):
+    fetched = []
+
+    async def fetch(*key):
+        fetched.append(key)
+        return WEATHER_DATA
+
+    monkeypatch.setattr(window, "admission", controller)
+    monkeypatch.setattr(weather_module.weather_client, "fetch", fetch)
+    monkeypatch.setattr(weather_module, "weather_cache", TTLCache(ttl=600, maxsize=10))
+
+    response = TestClient(app).get(
+        "/api/", params={"location": "12.34,56.78", "stream": "true"}
+    )
+    assert response.status_code == 200
+    assert response.text.startswith("<svg")
+    assert response.text.endswith("</svg>")
+    return response, fetched
+
+
+def test_streamed_window_takes_an_admission_slot(monkeypatch):
+    controller = AdmissionController(max_in_flight=1, max_queue=0)
+    response, fetched = stream(monkeypatch, controller)
+
+    assert "Somewhere" in response.text
+    assert len(fetched) == 1
+    assert controller.admitted == 1
+    assert controller.in_flight == 0
+
+
+def test_shed_stream_degrades_without_fetching(monkeypatch):
+    controller = AdmissionController(max_in_flight=0, max_queue=0)
+    response, fetched = stream(monkeypatch, controller)
+
+    assert fetched == []
+    assert controller.queue_full == 1
+    assert controller.in_flight == 0
@@ -0,0 +1,65 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from main import app
+from window import locations as locations_module, weather as weather_module
+from window.cache import TTLCache
+from window.locations import LocationStats
+from window.metrics import render_metrics
+from window.prefetch import PrefetchScheduler
+from window.warmup import readiness, warm_up
+
+
+def test_ready_reports_a_bool(monkeypatch):
+    client = TestClient(app)
+    monkeypatch.setattr(readiness, "ready", False)
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
+
+    monkeypatch.setattr(readiness, "ready", True)
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["ready"] is True
+
+
+def test_metrics_report_readiness_as_a_number(monkeypatch):
+    monkeypatch.setattr(readiness, "ready", True)
+    assert "livewindow_readiness_ready 1\n" in render_metrics()
+
+
+def test_warm_up_is_not_counted_as_traffic(monkeypatch):
+    weather_data = {
+        "coord": {"lat": 40.71, "lon": -74.01},
+        "name": "New York",
+        "main": {"temp": 21.5},
+        "weather": [{"icon": "10d", "description": "light rain"}],
+    }
+
+    async def fetch(*key):
+        return weather_data
+
+    cache = TTLCache(ttl=600, maxsize=10)
+    stats = LocationStats()
+    scheduler = PrefetchScheduler(cache, weather_module.fetch_weather)
+    monkeypatch.setattr(weather_module.weather_client, "fetch", fetch)
+    monkeypatch.setattr(weather_module, "weather_cache", cache)
+    monkeypatch.setattr(weather_module, "prefetch_scheduler", scheduler)
+    monkeypatch.setattr(locations_module, "location_stats", stats)
+    monkeypatch.setattr(readiness, "ready", False)
+    monkeypatch.setattr(readiness, "warmed", 0)
+    monkeypatch.setattr(readiness, "failed", 0)
+
+    async def main():
+        try:
+            await warm_up("40.7128,-74.0060")
+        finally:
+            await weather_module.weather_client.close()
+
+    asyncio.run(main())
+    assert readiness.ready
+    assert readiness.warmed == 1
+    assert cache.get(("metric", 40.71, -74.01, "en")) == weather_data
+    assert stats.stats()["canonical"] == 0
+    assert not scheduler.counts
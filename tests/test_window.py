@@ -0,0 +1,36 @@
+import asyncio
+
+import window
+from window import weather as weather_module
+from window.cache import TTLCache
+
+WEATHER_DATA = {
+    "coord": {"lat": 40.71, "lon": -74.01},
+    "name": "New York",
+    "main": {"temp": 21.5},
+    "weather": [{"icon": "10d", "description": "light rain"}],
+}
+
+
+def test_svg_entry_points_return_str(monkeypatch):
+    async def fetch(*key):
+        return WEATHER_DATA
+
+    monkeypatch.setattr(weather_module.weather_client, "fetch", fetch)
+    monkeypatch.setattr(
+        weather_module.weather_client, "fetch_sync", lambda *key: WEATHER_DATA
+    )
+    monkeypatch.setattr(weather_module, "weather_cache", TTLCache(ttl=600, maxsize=10))
+
+    svg = window.create_window_svg_sync("metric", 40.71, -74.01, "en")
+    assert isinstance(svg, str)
+    assert "New York" in svg
+    assert asyncio.run(window.create_window_svg("metric", 40.71, -74.01, "en")) == svg
+
+
+def test_moved_helpers_are_still_importable_from_window():
+    assert window.get_celestial_body_svg("01n").startswith("<svg")
+    assert window.get_weather_icon_svg("10d").startswith("<svg")
+    assert window.get_weather_icon_svg("99d") is None
+    assert window.getContrastColor({"r": 255, "g": 255, "b": 255}) == "black"
+    assert callable(window.getRealisticColorGradient)
@@ -0,0 +1,116 @@
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+
+from .constants import (
+    ADMISSION_MAX_IN_FLIGHT,
+    ADMISSION_MAX_QUEUE,
+    ADMISSION_QUEUE_TIMEOUT,
+)
+from .metrics import register_stats
+
+
+class Overloaded(Exception):
+    pass
+
+
+class QueueFull(Overloaded):
+    pass
+
+
+class DeadlineExceeded(Overloaded):
+    pass
+
+
+class AdmissionController:
+    """
+    Caps how many requests do the work at once. The rest wait in a bounded
+    FIFO queue, each only until its deadline, so under a spike a few
+    requests fail fast instead of every request getting slow.
+    """
+
+    COUNTERS = ("admitted", "queue_full", "deadline_exceeded")
+
+    def __init__(
+        self,
+        max_in_flight: int = ADMISSION_MAX_IN_FLIGHT,
+        max_queue: int = ADMISSION_MAX_QUEUE,
+        queue_timeout: float = ADMISSION_QUEUE_TIMEOUT,
+    ):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+        self.admitted = 0
+        self.queue_full = 0
+        self.deadline_exceeded = 0
+
+    async def acquire(self, timeout: float | None = None):
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self.queue_full += 1
+            raise QueueFull()
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(
+                waiter, self.queue_timeout if timeout is None else timeout
+            )
+        except BaseException as exc:
+            if waiter.done() and not waiter.cancelled():
+                # Handed a slot just as we gave up, pass it on
+                self.release()
+            else:
+                # release() may already have popped it, once cancelled
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+            if isinstance(exc, asyncio.TimeoutError):
+                self.deadline_exceeded += 1
+                raise DeadlineExceeded() from None
+            raise
+
+        self.admitted += 1
+
+    def release(self):
+        # The slot goes straight to the next waiter, so in_flight only drops
+        # when no one is queued
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    @asynccontextmanager
+    async def admit(self, timeout: float | None = None):
+        await self.acquire(timeout)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self):
+        return {
+            "in_flight": self.in_flight,
+            "queued": len(self._waiters),
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "queue_full": self.queue_full,
+            "deadline_exceeded": self.deadline_exceeded,
+        }
+
+
+admission = AdmissionController()
+register_stats("livewindow_admission", admission.stats, AdmissionController.COUNTERS)
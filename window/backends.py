@@ -0,0 +1,229 @@
+from collections import OrderedDict
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Hashable
+
+from .constants import CACHE_BACKEND, CACHE_PATH
+
+# Entries are (expires_at, value), with expires_at as a unix timestamp so
+# every process sharing a backend agrees on it
+Entry = tuple[float, Any]
+
+
+class MemoryBackend:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Entry] = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Entry | None:
+        entry = self._data.get(key)
+        if entry is not None:
+            self._data.move_to_end(key)
+        return entry
+
+    def set(self, key: Hashable, expires_at: float, value: Any) -> int:
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+
+        evicted = 0
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def delete(self, key: Hashable):
+        self._data.pop(key, None)
+
+    def clear(self):
+        self._data.clear()
+
+
+class SQLiteBackend:
+    """
+    A cache table in a local SQLite database in WAL mode, so every worker
+    process on the host reads and writes the same entries, and they survive
+    restarts. Values are stored with `dumps`/`loads`.
+    """
+
+    PRUNE_EVERY = 64
+
+    def __init__(
+        self,
+        path: str,
+        namespace: str,
+        maxsize: int,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[bytes], Any],
+        grace: float = 0.0,
+    ):
+        self.path = path
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.dumps = dumps
+        self.loads = loads
+        # Keep expired rows around this long, for stale reads
+        self.grace = grace
+
+        self._sets = 0
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    def _connect(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Only needed with the sqlite backend, so not imported up front
+        import sqlite3
+
+        conn = sqlite3.connect(
+            self.path, timeout=5, check_same_thread=False, isolation_level=None
+        )
+        conn.execute("PRAGMA busy_timeout = 5000")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                value BLOB NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (namespace, expires_at)"
+        )
+        return conn
+
+    def __len__(self):
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM cache WHERE namespace = ?", (self.namespace,)
+            ).fetchone()
+        return count
+
+    def get(self, key: Hashable) -> Entry | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at, value FROM cache WHERE namespace = ? AND key = ?",
+                (self.namespace, repr(key)),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], self.loads(row[1])
+
+    def set(self, key: Hashable, expires_at: float, value: Any) -> int:
+        data = self.dumps(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, expires_at, value) "
+                "VALUES (?, ?, ?, ?)",
+                (self.namespace, repr(key), expires_at, data),
+            )
+            self._sets += 1
+            if self._sets % self.PRUNE_EVERY:
+                return 0
+            return self._prune()
+
+    def _prune(self):
+        # Must be called with the lock held. Drops rows past their grace
+        # period, then the soonest to expire beyond `maxsize`
+        expired = self._conn.execute(
+            "DELETE FROM cache WHERE namespace = ? AND expires_at < ?",
+            (self.namespace, time.time() - self.grace),
+        ).rowcount
+        overflow = self._conn.execute(
+            """
+            DELETE FROM cache WHERE namespace = ? AND key IN (
+                SELECT key FROM cache WHERE namespace = ?
+                ORDER BY expires_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.namespace, self.namespace, self.maxsize),
+        ).rowcount
+        return expired + overflow
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND key = ?",
+                (self.namespace, repr(key)),
+            )
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM cache WHERE namespace = ?", (self.namespace,)
+            )
+
+
+class TieredBackend:
+    """
+    An in-process `MemoryBackend` in front of a shared backend, so hot keys
+    don't pay for a database read and deserialisation on every hit.
+    """
+
+    def __init__(self, local: MemoryBackend, shared: SQLiteBackend):
+        self.local = local
+        self.shared = shared
+
+    def __len__(self):
+        return len(self.shared)
+
+    def get(self, key: Hashable) -> Entry | None:
+        entry = self.local.get(key)
+        if entry is not None and entry[0] > time.time():
+            return entry
+
+        shared_entry = self.shared.get(key)
+        if shared_entry is None:
+            return entry
+
+        # Prefer whichever copy is fresher, another worker may have refreshed it
+        if entry is None or shared_entry[0] > entry[0]:
+            self.local.set(key, *shared_entry)
+            return shared_entry
+        return entry
+
+    def set(self, key: Hashable, expires_at: float, value: Any) -> int:
+        self.local.set(key, expires_at, value)
+        # Only what the shared backend drops is gone, the local tier just
+        # holds copies of it
+        return self.shared.set(key, expires_at, value)
+
+    def delete(self, key: Hashable):
+        self.local.delete(key)
+        self.shared.delete(key)
+
+    def clear(self):
+        self.local.clear()
+        self.shared.clear()
+
+
+def dump_json(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def create_backend(
+    namespace: str,
+    maxsize: int,
+    dumps: Callable[[Any], bytes] = dump_json,
+    loads: Callable[[bytes], Any] = json.loads,
+    grace: float = 0.0,
+    backend: str = CACHE_BACKEND,
+):
+    if backend == "memory":
+        return MemoryBackend(maxsize)
+    elif backend == "sqlite":
+        shared = SQLiteBackend(CACHE_PATH, namespace, maxsize, dumps, loads, grace)
+        return TieredBackend(MemoryBackend(maxsize), shared)
+    else:
+        raise ValueError(f"Unknown CACHE_BACKEND: {backend!r}")
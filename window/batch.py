@@ -0,0 +1,28 @@
+import asyncio
+from typing import Iterable
+
+from . import create_window
+from .constants import BATCH_CONCURRENCY, DEFAULT_LANG, DEFAULT_UNITS
+from .render import RenderedWindow
+from .types import LangEnum, UnitEnum
+
+
+async def create_windows(
+    locations: Iterable[tuple[float, float]],
+    units: UnitEnum = DEFAULT_UNITS,
+    lang: LangEnum = DEFAULT_LANG,
+    concurrency: int = BATCH_CONCURRENCY,
+) -> dict[tuple[float, float], RenderedWindow | Exception]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create(lat: float, lon: float):
+        async with semaphore:
+            return await create_window(units, lat, lon, lang)
+
+    # Identical locations are only fetched and rendered once
+    unique_locations = list(dict.fromkeys(locations))
+    results = await asyncio.gather(
+        *(create(lat, lon) for lat, lon in unique_locations),
+        return_exceptions=True,
+    )
+    return dict(zip(unique_locations, results))
@@ -0,0 +1,208 @@
+import asyncio
+from concurrent.futures import Future
+import threading
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+from .backends import MemoryBackend
+
+
+class TTLCache:
+    COUNTERS = (
+        "hits",
+        "stale_hits",
+        "misses",
+        "evictions",
+        "coalesced",
+        "refreshes",
+    )
+
+    def __init__(self, ttl: float, maxsize: int, stale_ttl: float = 0.0, backend=None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # How long past its ttl an entry may still be served while it refreshes
+        self.stale_ttl = stale_ttl
+
+        # Expiry times are wall clock, so entries in a shared backend mean the
+        # same thing to every process
+        self._data = backend if backend is not None else MemoryBackend(maxsize)
+        self._inflight: dict[Hashable, Future] = {}
+        self._background: set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.coalesced = 0
+        self.refreshes = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def _get_entry(self, key: Hashable, now: float, allow_stale: bool = False):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at + self.stale_ttl <= now:
+            self._data.delete(key)
+            return None
+
+        if expires_at <= now and not allow_stale:
+            return None
+
+        return entry
+
+    def _set(self, key: Hashable, value: Any, now: float):
+        self.evictions += self._data.set(key, now + self.ttl, value)
+
+    def get(self, key: Hashable, default: Any = None):
+        with self._lock:
+            entry = self._get_entry(key, time.time())
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._set(key, value, time.time())
+
+    def time_to_expiry(self, key: Hashable):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            return entry[0] - time.time()
+
+    def _join_or_lead(self, key: Hashable):
+        # Must be called with the lock held
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return future, False
+
+        future = Future()
+        self._inflight[key] = future
+        return future, True
+
+    def _begin_load(self, key: Hashable, allow_stale: bool = False):
+        with self._lock:
+            now = time.time()
+            entry = self._get_entry(key, now, allow_stale)
+            if entry is not None:
+                if entry[0] > now:
+                    self.hits += 1
+                else:
+                    self.stale_hits += 1
+                return entry, None, False
+
+            self.misses += 1
+            future, is_leader = self._join_or_lead(key)
+            return None, future, is_leader
+
+    def _finish_load(self, key: Hashable, future: Future, value: Any):
+        with self._lock:
+            self._set(key, value, time.time())
+            del self._inflight[key]
+        future.set_result(value)
+
+    def _fail_load(self, key: Hashable, future: Future, exc: BaseException):
+        with self._lock:
+            del self._inflight[key]
+        future.set_exception(exc)
+
+    async def _load_async(
+        self, key: Hashable, future: Future, loader: Callable[[], Awaitable[Any]]
+    ):
+        try:
+            value = await loader()
+        except BaseException as exc:
+            self._fail_load(key, future, exc)
+            raise
+
+        self._finish_load(key, future, value)
+        return value
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]):
+        entry, future, is_leader = self._begin_load(key)
+        if entry is not None:
+            return entry[1]
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as exc:
+            self._fail_load(key, future, exc)
+            raise
+
+        self._finish_load(key, future, value)
+        return value
+
+    async def get_or_load_async(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ):
+        entry, future, is_leader = self._begin_load(key, allow_stale=True)
+        if entry is not None:
+            if entry[0] <= time.time():
+                self.refresh_in_background(key, loader)
+            return entry[1]
+
+        if not is_leader:
+            return await asyncio.shield(asyncio.wrap_future(future))
+
+        return await self._load_async(key, future, loader)
+
+    async def refresh_async(self, key: Hashable, loader: Callable[[], Awaitable[Any]]):
+        with self._lock:
+            future, is_leader = self._join_or_lead(key)
+            if is_leader:
+                self.refreshes += 1
+
+        if not is_leader:
+            return await asyncio.shield(asyncio.wrap_future(future))
+
+        return await self._load_async(key, future, loader)
+
+    def refresh_in_background(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ):
+        with self._lock:
+            if key in self._inflight:
+                return
+
+        async def refresh():
+            try:
+                await self.refresh_async(key, loader)
+            except Exception:
+                # Keep serving the stale entry, the next request retries
+                pass
+
+        task = asyncio.create_task(refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "stale_ttl": self.stale_ttl,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "coalesced": self.coalesced,
+                "refreshes": self.refreshes,
+            }
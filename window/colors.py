@@ -0,0 +1,90 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from math import floor
+
+from .constants import SUNRISE_COLOR_IDX, SUNSET_COLOR_IDX, TIME_COLORS
+
+
+def getColorBlend(start_color, end_color, distance):
+    blend = defaultdict(int)
+    for part in ["r", "g", "b"]:
+        blend[part] = round(
+            start_color[part] + (end_color[part] - start_color[part]) * distance
+        )
+
+    return blend
+
+
+def getContrastColor(color):
+    return (
+        "black"
+        if (color["r"] * 0.299 + color["g"] * 0.587 + color["b"] * 0.114) > 186
+        else "white"
+    )
+
+
+def getRealisticColor(sunrise_time, sunset_time, now):
+    if now < sunrise_time:
+        color_phase = TIME_COLORS[0 : SUNRISE_COLOR_IDX + 1]
+        phase_start_time = datetime(now.year, now.month, now.day, 0, 0, 0, 0)
+        phase_end_time = sunrise_time
+    elif now >= sunset_time:
+        color_phase = TIME_COLORS[SUNSET_COLOR_IDX:]
+        color_phase.append(TIME_COLORS[0])
+        phase_start_time = sunset_time
+        phase_end_time = datetime(
+            sunset_time.year, sunset_time.month, sunset_time.day, 23, 59, 59, 999
+        )
+    else:
+        color_phase = TIME_COLORS[SUNRISE_COLOR_IDX : SUNSET_COLOR_IDX + 1]
+        phase_start_time = sunrise_time
+        phase_end_time = sunset_time
+
+    time_since_start = now - phase_start_time
+    time_in_phase = phase_end_time - phase_start_time
+    distance = time_since_start / time_in_phase
+
+    phase_segments = time_in_phase / (len(color_phase) - 1)
+    start_color_idx = floor((len(color_phase) - 1) * distance)
+    start_color_idx = (
+        start_color_idx if start_color_idx < len(color_phase) else len(color_phase) - 1
+    )
+    end_color_idx = (
+        start_color_idx + 1
+        if start_color_idx < len(color_phase) - 1
+        else len(color_phase) - 1
+    )
+
+    start_color_time = phase_start_time + start_color_idx * phase_segments
+    end_color_time = phase_start_time + end_color_idx * phase_segments
+
+    time_in_segments = end_color_time - start_color_time
+    time_since_segment_start = now - start_color_time
+    distance_in_segment = (
+        time_since_segment_start / time_in_segments if time_in_segments else 1
+    )
+    start_color = color_phase[start_color_idx]
+    end_color = color_phase[end_color_idx]
+
+    return getColorBlend(start_color, end_color, distance_in_segment)
+
+
+def getRealisticColorGradient(sunrise_time, sunset_time, now=None):
+    now = now or datetime.now()
+    hour_ago = now - timedelta(hours=1)
+
+    gradientStart = getRealisticColor(sunrise_time, sunset_time, hour_ago)
+    gradientEnd = getRealisticColor(sunrise_time, sunset_time, now)
+
+    if now >= sunset_time:
+        gradient = {
+            "start": gradientEnd,
+            "end": gradientStart,
+        }
+    else:
+        gradient = {
+            "start": gradientStart,
+            "end": gradientEnd,
+        }
+
+    return gradient
@@ -0,0 +1,111 @@
+from functools import lru_cache
+import struct
+from typing import Iterable
+import zlib
+
+from .constants import BROTLI_QUALITY, GZIP_LEVEL
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is an optional extra
+    brotli = None
+
+GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+# Final, empty fixed-huffman deflate block
+DEFLATE_END = b"\x03\x00"
+
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+@lru_cache(maxsize=1024)
+def deflate_chunk(chunk: bytes) -> bytes:
+    # A full flush byte-aligns the output and resets the compressor, so
+    # independently deflated chunks can be concatenated into one stream
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(chunk) + compressor.flush(zlib.Z_FULL_FLUSH)
+
+
+class IdentityStream:
+    def start(self) -> bytes:
+        return b""
+
+    def compress(self, chunk: bytes) -> bytes:
+        return chunk
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class GzipStream:
+    """
+    Gzips chunks as they arrive, giving the same bytes as `gzip_chunks`.
+    """
+
+    def __init__(self):
+        self.crc = 0
+        self.size = 0
+
+    def start(self) -> bytes:
+        return GZIP_HEADER
+
+    def compress(self, chunk: bytes) -> bytes:
+        self.crc = zlib.crc32(chunk, self.crc)
+        self.size += len(chunk)
+        return deflate_chunk(chunk)
+
+    def finish(self) -> bytes:
+        return DEFLATE_END + struct.pack("<II", self.crc, self.size & 0xFFFFFFFF)
+
+
+# Encodings a response can be sent in while it's still being rendered
+STREAM_ENCODINGS = {"gzip": GzipStream, "identity": IdentityStream}
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> bytes:
+    stream = GzipStream()
+    body = [stream.start()]
+    body.extend(stream.compress(chunk) for chunk in chunks)
+    body.append(stream.finish())
+    return b"".join(body)
+
+
+def brotli_chunks(chunks: Iterable[bytes]) -> bytes:
+    # Brotli streams can't be spliced like deflate, so the whole document is
+    # compressed; callers memoise the result per rendered window
+    return brotli.compress(b"".join(chunks), quality=BROTLI_QUALITY)
+
+
+def encode_chunks(chunks: Iterable[bytes], encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip_chunks(chunks)
+    elif encoding == "br":
+        return brotli_chunks(chunks)
+    else:
+        return b"".join(chunks)
+
+
+def select_encoding(
+    accept_encoding: str | None, supported: Iterable[str] = SUPPORTED_ENCODINGS
+):
+    if not accept_encoding:
+        return "identity"
+
+    preferences = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        preferences[coding.strip().lower()] = quality
+
+    best, best_quality = "identity", 0.0
+    for encoding in supported:
+        quality = preferences.get(encoding, preferences.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+
+    return best
@@ -7,6 +7,89 @@ from .types import LangEnum, UnitEnum
 load_dotenv()
 
 OPEN_WEATHER_API_KEY = os.getenv("OPEN_WEATHER_API_KEY")
+OPEN_WEATHER_BASE_URL = os.getenv(
+    "OPEN_WEATHER_BASE_URL", "https://api.openweathermap.org/data/2.5"
+)
+# Where cached weather and renders live: "memory" (per process) or "sqlite"
+# (a file shared by every worker on the host, kept across restarts)
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()
+CACHE_PATH = os.getenv("CACHE_PATH", ".cache/live-window.sqlite3")
+
+RENDER_CACHE_TTL = float(os.getenv("RENDER_CACHE_TTL", 600))
+RENDER_CACHE_MAXSIZE = int(os.getenv("RENDER_CACHE_MAXSIZE", 1024))
+# Upper bound for the Cache-Control max-age of a rendered window
+CACHE_MAX_AGE = int(os.getenv("CACHE_MAX_AGE", 600))
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+SVG_MINIFY = os.getenv("SVG_MINIFY", "true").lower() in ("1", "true", "yes")
+# Decimal places kept for coordinates in the minified svg
+SVG_PRECISION = int(os.getenv("SVG_PRECISION", 2))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", 9))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", 9))
+
+WEATHER_CONNECT_TIMEOUT = float(os.getenv("WEATHER_CONNECT_TIMEOUT", 3))
+WEATHER_READ_TIMEOUT = float(os.getenv("WEATHER_READ_TIMEOUT", 5))
+WEATHER_MAX_CONNECTIONS = int(os.getenv("WEATHER_MAX_CONNECTIONS", 100))
+WEATHER_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.getenv("WEATHER_MAX_KEEPALIVE_CONNECTIONS", 20)
+)
+
+# OpenWeather only refreshes its data roughly every 10 minutes
+WEATHER_CACHE_TTL = float(os.getenv("WEATHER_CACHE_TTL", 600))
+WEATHER_CACHE_MAXSIZE = int(os.getenv("WEATHER_CACHE_MAXSIZE", 1024))
+# Expired weather is still served for this long while it refreshes
+WEATHER_STALE_TTL = float(os.getenv("WEATHER_STALE_TTL", 600))
+# OpenWeather's 5 day forecast moves in 3 hour steps
+FORECAST_CACHE_TTL = float(os.getenv("FORECAST_CACHE_TTL", 1800))
+FORECAST_MAX_HOURS = int(os.getenv("FORECAST_MAX_HOURS", 120))
+FORECAST_MAX_FRAMES = int(os.getenv("FORECAST_MAX_FRAMES", 288))
+# The last good payload for a location is kept this long, as a fallback
+WEATHER_FALLBACK_TTL = float(os.getenv("WEATHER_FALLBACK_TTL", 86400))
+# How long a request waits on OpenWeather before serving a fallback window
+WEATHER_LATENCY_BUDGET = float(os.getenv("WEATHER_LATENCY_BUDGET", 1.5))
+# Calls per minute allowed by our OpenWeather plan, and how many may burst
+WEATHER_RATE_LIMIT = float(os.getenv("WEATHER_RATE_LIMIT", 60))
+WEATHER_RATE_BURST = float(os.getenv("WEATHER_RATE_BURST", 10))
+# Fail fast after this many upstream errors in a row, for this many seconds
+WEATHER_BREAKER_THRESHOLD = int(os.getenv("WEATHER_BREAKER_THRESHOLD", 5))
+WEATHER_BREAKER_RESET = float(os.getenv("WEATHER_BREAKER_RESET", 30))
+# Cache-Control max-age for windows rendered from fallback weather
+FALLBACK_MAX_AGE = int(os.getenv("FALLBACK_MAX_AGE", 60))
+
+# Keep the most requested locations warm by refreshing them before expiry
+PREFETCH_TOP_K = int(os.getenv("PREFETCH_TOP_K", 50))
+PREFETCH_LEAD_TIME = float(os.getenv("PREFETCH_LEAD_TIME", 60))
+PREFETCH_MAX_CONCURRENCY = int(os.getenv("PREFETCH_MAX_CONCURRENCY", 5))
+PREFETCH_INTERVAL = float(os.getenv("PREFETCH_INTERVAL", 15))
+
+# Requested coordinates are rounded to a grid this many degrees wide (0.01
+# is ~1km) so near-identical locations share cache entries, 0 disables it
+LOCATION_GRID = float(os.getenv("LOCATION_GRID", 0.01))
+# Snap locations within this many km of a bundled city to the city, 0
+# disables it
+LOCATION_SNAP_RADIUS = float(os.getenv("LOCATION_SNAP_RADIUS", 0))
+# Canonical locations tracked for the raw coordinate report
+LOCATION_STATS_MAXSIZE = int(os.getenv("LOCATION_STATS_MAXSIZE", 1024))
+
+# Windows rendered at once by /api/, with up to ADMISSION_MAX_QUEUE more
+# waiting at most ADMISSION_QUEUE_TIMEOUT seconds for a turn. Anything past
+# that is shed: served from cached weather (or just the sky) when the shed
+# mode is "degrade", or turned away with a 503 when it's "reject"
+ADMISSION_MAX_IN_FLIGHT = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", 64))
+ADMISSION_MAX_QUEUE = int(os.getenv("ADMISSION_MAX_QUEUE", 128))
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", 0.5))
+ADMISSION_SHED_MODE = os.getenv("ADMISSION_SHED_MODE", "degrade")
+ADMISSION_RETRY_AFTER = int(os.getenv("ADMISSION_RETRY_AFTER", 1))
+
+BATCH_MAX_LOCATIONS = int(os.getenv("BATCH_MAX_LOCATIONS", 100))
+# Max upstream fetches in flight for a single batch request
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", 10))
+
+# Live windows re-render each subscribed location at least this often (and
+# whenever the sky changes), and ping idle connections this often
+LIVE_TICK_INTERVAL = float(os.getenv("LIVE_TICK_INTERVAL", 30))
+LIVE_HEARTBEAT_INTERVAL = float(os.getenv("LIVE_HEARTBEAT_INTERVAL", 15))
 
 # New York City
 DEFAULT_LOCATION = {
@@ -16,6 +99,14 @@ DEFAULT_LOCATION = {
 DEFAULT_LANG = LangEnum.en
 DEFAULT_UNITS = UnitEnum.metric
 
+# Locations ("lat,lng;lat,lng") fetched and rendered on startup, before the
+# app reports itself ready; empty skips the upstream part of the warm-up
+WARMUP_LOCATIONS = os.getenv(
+    "WARMUP_LOCATIONS", f"{DEFAULT_LOCATION['lat']},{DEFAULT_LOCATION['lng']}"
+)
+# Give up on warming and report ready anyway after this many seconds
+WARMUP_TIMEOUT = float(os.getenv("WARMUP_TIMEOUT", 10))
+
 
 HOURS_IN_DAY = 24
 MINUTES_IN_HOUR = 60
@@ -31,3 +122,8 @@ TIME_COLORS = [
 ]
 SUNRISE_COLOR_IDX = 2
 SUNSET_COLOR_IDX = 6
+SKY_TABLE_CACHE_SIZE = int(os.getenv("SKY_TABLE_CACHE_SIZE", 256))
+# Sun times are computed locally, per location rounded to this many decimal
+# places (~1km, well under a second of sunrise) and per date
+SOLAR_PRECISION = int(os.getenv("SOLAR_PRECISION", 2))
+SUN_TIMES_CACHE_SIZE = int(os.getenv("SUN_TIMES_CACHE_SIZE", 4096))
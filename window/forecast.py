@@ -0,0 +1,226 @@
+import asyncio
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+from xml.sax.saxutils import escape
+
+from .colors import getContrastColor
+from .constants import DEFAULT_LANG, DEFAULT_LOCATION, DEFAULT_UNITS
+from .icons import get_celestial_body_svg, get_weather_icon_svg
+from .render import format_rgb, get_currently_text
+from .sky import get_sky_gradient
+from .solar import get_local_sun_times, get_local_time, get_utc_offset
+from .template import WINDOW_SVG
+from .types import UnitEnum
+from .weather import get_forecast_data, get_weather_data
+
+
+class Frame(NamedTuple):
+    time: datetime
+    start_color: str
+    end_color: str
+    text_color: str
+    currently: str
+    # OpenWeather icon code, with the d/n suffix from the local sun times
+    icon: str
+
+
+def get_forecast_entries(
+    weather_data: dict, forecast_data: dict | None, start: datetime
+):
+    # The current weather covers the time until the first forecast step
+    current = {**weather_data, "dt": float("-inf")}
+    if forecast_data is None or weather_data.get("fallback"):
+        return [current]
+
+    # A cached forecast can have steps that are already behind us
+    upcoming = [
+        entry for entry in forecast_data["list"] if entry["dt"] > start.timestamp()
+    ]
+    return [current, *sorted(upcoming, key=lambda entry: entry["dt"])]
+
+
+def build_frames(
+    weather_data: dict,
+    forecast_data: dict | None,
+    units: UnitEnum = DEFAULT_UNITS,
+    hours: int = 12,
+    step: int = 60,
+    now: datetime | None = None,
+) -> list[Frame]:
+    """
+    A frame every `step` minutes for the next `hours`, starting this minute.
+    Each uses the latest forecast at or before its time.
+    """
+    lat, lon = weather_data["coord"]["lat"], weather_data["coord"]["lon"]
+    utc_offset = get_utc_offset(lon, weather_data)
+
+    start = (now or datetime.now(timezone.utc)).replace(second=0, microsecond=0)
+    entries = get_forecast_entries(weather_data, forecast_data, start)
+    entry_times = [entry["dt"] for entry in entries]
+    frames = []
+    for idx in range(hours * 60 // step):
+        frame_time = start + timedelta(minutes=idx * step)
+        entry = entries[bisect_right(entry_times, frame_time.timestamp()) - 1]
+
+        local_time = get_local_time(utc_offset, frame_time)
+        sunrise_time, sunset_time = get_local_sun_times(
+            lat, lon, utc_offset, local_time.date()
+        )
+        gradient = get_sky_gradient(sunrise_time, sunset_time, local_time)
+        is_day = sunrise_time <= local_time < sunset_time
+
+        frames.append(
+            Frame(
+                time=frame_time,
+                start_color=format_rgb(gradient["start"]),
+                end_color=format_rgb(gradient["end"]),
+                text_color=getContrastColor(gradient["end"]),
+                currently=get_currently_text(entry, units),
+                icon=entry["weather"][0]["icon"][:-1] + ("d" if is_day else "n"),
+            )
+        )
+
+    return frames
+
+
+def get_key_times(frames: list[Frame], values: list[str]):
+    # Only the frames where the value changes, as (value, fraction of the
+    # timeline) pairs
+    changes = []
+    for idx, value in enumerate(values):
+        if not changes or changes[-1][0] != value:
+            changes.append((value, idx / len(frames)))
+    return changes
+
+
+def animate_discrete(attribute: str, changes: list[tuple[str, float]], duration: int):
+    values = ";".join(value for value, _ in changes)
+    key_times = ";".join(f"{key_time:.4f}" for _, key_time in changes)
+    return (
+        f'<animate attributeName="{attribute}" values="{values}" '
+        f'keyTimes="{key_times}" dur="{duration}s" calcMode="discrete" fill="freeze"/>'
+    )
+
+
+def animate_linear(attribute: str, values: list[str], duration: int):
+    # Blends smoothly between frames, like the sky does
+    if len(values) < 2:
+        return ""
+    return (
+        f'<animate attributeName="{attribute}" values="{";".join(values)}" '
+        f'dur="{duration}s" fill="freeze"/>'
+    )
+
+
+def render_variants(
+    frames: list[Frame],
+    values: list[str],
+    markup: dict[str, bytes],
+    duration: int,
+    tag: str = "g",
+):
+    """
+    Every distinct value's markup, each shown only while it's current.
+    """
+    variants = []
+    for variant in dict.fromkeys(values):
+        shown = get_key_times(
+            frames, ["inline" if value == variant else "none" for value in values]
+        )
+        display = "inline" if values[0] == variant else "none"
+        animation = (
+            animate_discrete("display", shown, duration) if len(shown) > 1 else ""
+        )
+        variants.append(
+            f'<{tag} display="{display}">{animation}'.encode()
+            + markup[variant]
+            + f"</{tag}>".encode()
+        )
+    return b"".join(variants)
+
+
+def render_timeline_svg(frames: list[Frame], location: str, step: int) -> bytes:
+    """
+    One svg that plays `frames` in real time with SMIL, starting from when it's
+    loaded: blended gradient stops, and icons, text and its colour switching
+    at each forecast step.
+    """
+    duration = len(frames) * step * 60
+    linear_duration = (len(frames) - 1) * step * 60
+
+    icons = [frame.icon for frame in frames]
+    texts = [frame.currently for frame in frames]
+    celestial_bodies = [icon[-1] for icon in icons]
+    weather_icons = [icon[:-1] for icon in icons]
+
+    text_color = get_key_times(frames, [frame.text_color for frame in frames])
+    text_animation = (
+        animate_discrete("fill", text_color, duration) if len(text_color) > 1 else ""
+    )
+
+    celestial_body_svg = render_variants(
+        frames,
+        celestial_bodies,
+        {body: get_celestial_body_svg(body) for body in celestial_bodies},
+        duration,
+    )
+    weather_icon_svg = render_variants(
+        frames,
+        weather_icons,
+        {code: get_weather_icon_svg(code + "d") or b"" for code in weather_icons},
+        duration,
+    )
+    currently = render_variants(
+        frames,
+        texts,
+        {text: escape(text).encode() for text in texts},
+        duration,
+        tag="tspan",
+    )
+
+    return WINDOW_SVG.render(
+        start_color=frames[0].start_color,
+        end_color=frames[0].end_color,
+        start_color_animation=animate_linear(
+            "stop-color", [frame.start_color for frame in frames], linear_duration
+        ),
+        end_color_animation=animate_linear(
+            "stop-color", [frame.end_color for frame in frames], linear_duration
+        ),
+        text_color=frames[0].text_color,
+        location=escape(location) + text_animation,
+        currently=currently + text_animation.encode(),
+        celestial_body_svg=celestial_body_svg,
+        weather_icon_svg=weather_icon_svg,
+    )
+
+
+def format_frames(frames: list[Frame]):
+    return [
+        {
+            "time": frame.time.isoformat(),
+            "start_color": frame.start_color,
+            "end_color": frame.end_color,
+            "text_color": frame.text_color,
+            "currently": frame.currently,
+            "icon": frame.icon,
+        }
+        for frame in frames
+    ]
+
+
+async def create_forecast(
+    units: UnitEnum = DEFAULT_UNITS,
+    lat: float = DEFAULT_LOCATION["lat"],
+    lon: float = DEFAULT_LOCATION["lng"],
+    lang: str = DEFAULT_LANG,
+    hours: int = 12,
+    step: int = 60,
+):
+    weather_data, forecast_data = await asyncio.gather(
+        get_weather_data(units, lat, lon, lang),
+        get_forecast_data(units, lat, lon, lang),
+    )
+    frames = build_frames(weather_data, forecast_data, units, hours, step)
+    return weather_data["name"], frames
@@ -0,0 +1,44 @@
+from pathlib import Path
+from types import MappingProxyType
+
+from .constants import SVG_MINIFY, SVG_PRECISION
+from .minify import minify_svg
+
+SVGS_DIR = Path(__file__).parent / "svgs"
+
+
+def load_icon(path: Path):
+    svg = path.read_text()
+    if SVG_MINIFY:
+        # Icons define their own gradients, keep all of them
+        svg = minify_svg(svg, SVG_PRECISION, drop_unused_defs=False)
+    return svg.encode()
+
+
+def load_icons(directory: Path = SVGS_DIR):
+    return MappingProxyType(
+        {path.stem: load_icon(path) for path in sorted(directory.glob("*.svg"))}
+    )
+
+
+ICONS = load_icons()
+
+# Keyed by the OpenWeather icon code suffix, `d` (day) or `n` (night)
+CELESTIAL_BODY_ICONS = MappingProxyType({"d": ICONS["sun"], "n": ICONS["moon"]})
+
+# Keyed by the OpenWeather icon code without its day/night suffix, e.g. `02`
+WEATHER_ICONS = MappingProxyType(
+    {
+        name.removeprefix("weather-"): svg
+        for name, svg in ICONS.items()
+        if name.startswith("weather-")
+    }
+)
+
+
+def get_celestial_body_svg(icon: str):
+    return CELESTIAL_BODY_ICONS["n" if icon[-1] == "n" else "d"]
+
+
+def get_weather_icon_svg(icon: str):
+    return WEATHER_ICONS.get(icon[:-1])
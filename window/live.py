@@ -0,0 +1,173 @@
+import asyncio
+import contextvars
+import json
+import logging
+from typing import AsyncIterator
+from xml.sax.saxutils import unescape
+
+from . import create_window
+from .constants import LIVE_HEARTBEAT_INTERVAL, LIVE_TICK_INTERVAL
+from .metrics import register_stats
+from .render import RenderedWindow
+from .template import WINDOW_SVG
+
+logger = logging.getLogger(__name__)
+
+# Slots holding escaped text, sent unescaped for the client's textContent
+TEXT_SLOTS = frozenset(("location", "currently"))
+
+
+def get_slot_values(window: RenderedWindow) -> dict[str, str]:
+    values = {}
+    for idx, name in WINDOW_SVG.slots:
+        value = window.chunks[idx].decode()
+        values[name] = unescape(value) if name in TEXT_SLOTS else value
+    return values
+
+
+def format_event(event: str, data: dict) -> bytes:
+    return (
+        f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode()
+    )
+
+
+class LiveChannel:
+    """
+    One location's live window. A single task renders it every tick and
+    wakes the subscribers, however many there are.
+    """
+
+    def __init__(self, key: tuple, interval: float = LIVE_TICK_INTERVAL):
+        self.key = key
+        self.interval = interval
+
+        self.window: RenderedWindow | None = None
+        self.values: dict[str, str] = {}
+        self.version = 0
+        # The previous tick's delta, already encoded, for subscribers that
+        # are up to date
+        self.delta_event = b""
+        self.subscribers: set[asyncio.Event] = set()
+        self.ready = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def tick(self):
+        window = await create_window(*self.key)
+        values = get_slot_values(window)
+        delta = {
+            name: value
+            for name, value in values.items()
+            if self.values.get(name) != value
+        }
+
+        self.window = window
+        if delta or not self.ready.is_set():
+            self.values = values
+            self.version += 1
+            self.delta_event = format_event("delta", delta)
+            for subscriber in self.subscribers:
+                subscriber.set()
+        self.ready.set()
+        return window
+
+    async def run(self):
+        while True:
+            try:
+                window = await self.tick()
+                # Wake up exactly when the sky is next due to change
+                delay = min(self.interval, max(1, window.max_age()))
+            except Exception:
+                logger.warning(
+                    "Failed to update live window %s", self.key, exc_info=True
+                )
+                delay = self.interval
+                # Don't leave the first subscribers waiting on a window that
+                # isn't coming
+                self.ready.set()
+            await asyncio.sleep(delay)
+
+    def start(self):
+        if self._task is None:
+            # A fresh context, so ticks aren't timed as part of the request
+            # that happened to open the channel
+            self._task = asyncio.create_task(self.run(), context=contextvars.Context())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+class LiveHub:
+    def __init__(self):
+        self.channels: dict[tuple, LiveChannel] = {}
+
+    async def subscribe(
+        self, key: tuple, heartbeat: float = LIVE_HEARTBEAT_INTERVAL
+    ) -> AsyncIterator[bytes]:
+        """
+        Server-sent events for a live window: the full svg once, then only
+        the template values that changed.
+        """
+        channel = self.channels.get(key)
+        if channel is None:
+            channel = self.channels[key] = LiveChannel(key)
+            channel.start()
+
+        wakeup = asyncio.Event()
+        channel.subscribers.add(wakeup)
+        try:
+            await channel.ready.wait()
+            if channel.window is None:
+                # The client reconnects on its own, which starts a new try
+                yield format_event("error", {"detail": "Failed to render window"})
+                return
+            wakeup.clear()
+            version = channel.version
+            last_values = channel.values
+            yield format_event("window", {"svg": channel.window.svg.decode()})
+
+            while True:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield b": ping\n\n"
+                    continue
+
+                wakeup.clear()
+                if channel.version == version:
+                    continue
+                elif channel.version == version + 1:
+                    yield channel.delta_event
+                else:
+                    # Missed a tick or more, diff against what this client has
+                    delta = {
+                        name: value
+                        for name, value in channel.values.items()
+                        if last_values.get(name) != value
+                    }
+                    yield format_event("delta", delta)
+                version = channel.version
+                last_values = channel.values
+        finally:
+            channel.subscribers.discard(wakeup)
+            if not channel.subscribers and self.channels.get(key) is channel:
+                del self.channels[key]
+                channel.stop()
+
+    def close(self):
+        for channel in self.channels.values():
+            channel.stop()
+        self.channels.clear()
+
+    def stats(self):
+        return {
+            "channels": len(self.channels),
+            "subscribers": sum(
+                len(channel.subscribers) for channel in self.channels.values()
+            ),
+        }
+
+
+live_hub = LiveHub()
+register_stats("livewindow_live", live_hub.stats)
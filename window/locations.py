@@ -0,0 +1,229 @@
+from collections import OrderedDict
+import csv
+from functools import lru_cache
+from math import asin, cos, inf, isfinite, radians, sin, sqrt
+from pathlib import Path
+import threading
+from typing import NamedTuple
+
+from .constants import (
+    DEFAULT_LOCATION,
+    LOCATION_GRID,
+    LOCATION_SNAP_RADIUS,
+    LOCATION_STATS_MAXSIZE,
+)
+from .metrics import register_stats
+
+# Generated from the tz database's zone.tab, one city per time zone
+CITIES_PATH = Path(__file__).parent / "data" / "cities.csv"
+EARTH_RADIUS_KM = 6371.0
+
+
+class City(NamedTuple):
+    name: str
+    country: str
+    lat: float
+    lon: float
+    timezone: str
+
+
+def load_cities(path: Path = CITIES_PATH):
+    with open(path, newline="") as f:
+        return [
+            City(
+                row["name"],
+                row["country"],
+                float(row["lat"]),
+                float(row["lon"]),
+                row["timezone"],
+            )
+            for row in csv.DictReader(f)
+        ]
+
+
+def to_unit_vector(lat: float, lon: float):
+    lat, lon = radians(lat), radians(lon)
+    return (cos(lat) * cos(lon), cos(lat) * sin(lon), sin(lat))
+
+
+def chord_to_km(chord: float):
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, chord / 2))
+
+
+class CityIndex:
+    """
+    A k-d tree over cities as points on the unit sphere, so straight-line
+    distance orders them the same as distance along the surface and there's
+    no wrap-around at the antimeridian.
+    """
+
+    def __init__(self, cities: list[City]):
+        self.cities = cities
+        self.by_location = {(city.lat, city.lon): city for city in cities}
+        points = [
+            (to_unit_vector(city.lat, city.lon), idx) for idx, city in enumerate(cities)
+        ]
+        self.root = self._build(points, 0)
+
+    def _build(self, points: list, depth: int):
+        if not points:
+            return None
+
+        axis = depth % 3
+        points.sort(key=lambda point: point[0][axis])
+        mid = len(points) // 2
+        vector, idx = points[mid]
+        return (
+            vector,
+            idx,
+            axis,
+            self._build(points[:mid], depth + 1),
+            self._build(points[mid + 1 :], depth + 1),
+        )
+
+    def nearest(self, lat: float, lon: float) -> tuple[City, float]:
+        target = to_unit_vector(lat, lon)
+        best_idx, best_distance = -1, inf
+
+        def search(node):
+            nonlocal best_idx, best_distance
+            if node is None:
+                return
+
+            vector, idx, axis, left, right = node
+            distance = sum((a - b) ** 2 for a, b in zip(vector, target))
+            if distance < best_distance:
+                best_idx, best_distance = idx, distance
+
+            diff = target[axis] - vector[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            search(near)
+            if diff * diff < best_distance:
+                search(far)
+
+        search(self.root)
+        return self.cities[best_idx], chord_to_km(sqrt(best_distance))
+
+
+class LocationStats:
+    # Stop collecting raw coordinates for a key past this, the count is then
+    # a lower bound
+    MAX_RAW_PER_KEY = 1000
+
+    def __init__(self, maxsize: int = LOCATION_STATS_MAXSIZE):
+        self.maxsize = maxsize
+        self._keys: OrderedDict[tuple[float, float], tuple[set, list[int]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def record(self, raw: tuple[float, float], canonical: tuple[float, float]):
+        with self._lock:
+            entry = self._keys.get(canonical)
+            if entry is None:
+                entry = self._keys[canonical] = (set(), [0])
+                if len(self._keys) > self.maxsize:
+                    self._keys.popitem(last=False)
+            else:
+                self._keys.move_to_end(canonical)
+
+            raw_locations, requests = entry
+            if len(raw_locations) < self.MAX_RAW_PER_KEY:
+                raw_locations.add(raw)
+            requests[0] += 1
+
+    def report(self, limit: int | None = None):
+        """
+        Canonical locations, most distinct raw coordinates first.
+        """
+        with self._lock:
+            rows = [
+                {
+                    "lat": lat,
+                    "lon": lon,
+                    "raw_locations": len(raw_locations),
+                    "requests": requests[0],
+                }
+                for (lat, lon), (raw_locations, requests) in self._keys.items()
+            ]
+
+        rows.sort(key=lambda row: (row["raw_locations"], row["requests"]), reverse=True)
+        return rows[:limit]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "canonical": len(self._keys),
+                "raw": sum(
+                    len(raw_locations) for raw_locations, _ in self._keys.values()
+                ),
+            }
+
+
+city_index = CityIndex(load_cities()) if LOCATION_SNAP_RADIUS > 0 else None
+location_stats = LocationStats()
+register_stats("livewindow_locations", location_stats.stats)
+
+
+def parse_location(location: str):
+    lat_str, lon_str = location.split(",")
+
+    lat = float(lat_str) if lat_str else None
+    lon = float(lon_str) if lon_str else None
+
+    if lat is None or lon is None:
+        lat, lon = DEFAULT_LOCATION["lat"], DEFAULT_LOCATION["lng"]
+
+    # float() happily parses "inf" and "nan", which can't be put on the grid
+    if not (isfinite(lat) and isfinite(lon)):
+        raise ValueError(f"Location must be finite: {location!r}")
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise ValueError(f"Location out of range: {location!r}")
+
+    return lat, lon
+
+
+def quantise_location(lat: float, lon: float, grid: float = LOCATION_GRID):
+    if grid <= 0:
+        return lat, lon
+    # Rounded again to drop float noise, e.g. 4071 * 0.01 = 40.710000000000001
+    return round(round(lat / grid) * grid, 6), round(round(lon / grid) * grid, 6)
+
+
+@lru_cache(maxsize=LOCATION_STATS_MAXSIZE)
+def snap_location(lat: float, lon: float, radius: float = LOCATION_SNAP_RADIUS):
+    city, distance = city_index.nearest(lat, lon)
+    if distance <= radius:
+        return city.lat, city.lon
+    return lat, lon
+
+
+def get_canonical_location(lat: float, lon: float):
+    """
+    The canonical location for `lat, lon`: on the grid, or snapped to a
+    nearby city when enabled. Locations that render the same share a key.
+    """
+    canonical = quantise_location(lat, lon)
+    if city_index is not None:
+        canonical = snap_location(*canonical)
+    return canonical
+
+
+def normalise_location(lat: float, lon: float):
+    # Counted in the location report, unlike get_canonical_location
+    canonical = get_canonical_location(lat, lon)
+    location_stats.record((lat, lon), canonical)
+    return canonical
+
+
+def resolve_location(location: str):
+    return normalise_location(*parse_location(location))
+
+
+def get_location_report(limit: int | None = None):
+    report = location_stats.report(limit)
+    if city_index is not None:
+        for row in report:
+            city = city_index.by_location.get((row["lat"], row["lon"]))
+            row["city"] = city.name if city else None
+    return report
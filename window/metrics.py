@@ -0,0 +1,285 @@
+from bisect import bisect_left
+from contextlib import nullcontext
+from contextvars import ContextVar
+import threading
+import time
+from typing import Callable, Iterable
+
+from .constants import METRICS_ENABLED
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+
+def escape_label_value(value: str):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(names: tuple[str, ...], values: tuple[str, ...], **extra: str):
+    pairs = list(zip(names, values)) + list(extra.items())
+    if not pairs:
+        return ""
+    labels = ",".join(
+        f'{name}="{escape_label_value(str(value))}"' for name, value in pairs
+    )
+    return "{" + labels + "}"
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str):
+        key = tuple(str(labels[name]) for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def collect(self):
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} counter"
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            yield f"{self.name}{format_labels(self.labels, key)} {value}"
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets
+        # Per label set: a count per bucket (plus +Inf), then the sum
+        self._values: dict[tuple[str, ...], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str):
+        key = tuple(str(labels[name]) for name in self.labels)
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0] * (len(self.buckets) + 2)
+            counts[idx] += 1
+            counts[-1] += value
+
+    def collect(self):
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            values = [(key, list(counts)) for key, counts in self._values.items()]
+        for key, counts in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                labels = format_labels(self.labels, key, le=le)
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = format_labels(self.labels, key)
+            yield f"{self.name}_sum{labels} {counts[-1]}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+REQUEST_SECONDS = Histogram(
+    "livewindow_request_duration_seconds",
+    "Time spent handling a request.",
+    labels=("path", "status"),
+)
+STAGE_SECONDS = Histogram(
+    "livewindow_stage_duration_seconds",
+    "Time spent in each stage of rendering a window.",
+    labels=("stage",),
+)
+UPSTREAM_SECONDS = Histogram(
+    "livewindow_upstream_duration_seconds",
+    "Time spent waiting on OpenWeather.",
+)
+UPSTREAM_RESPONSES = Counter(
+    "livewindow_upstream_responses_total",
+    "OpenWeather responses by status code.",
+    labels=("status",),
+)
+
+WEATHER_FALLBACKS = Counter(
+    "livewindow_weather_fallbacks_total",
+    "Windows rendered without fresh weather, by fallback used.",
+    labels=("kind",),
+)
+
+METRICS = [
+    REQUEST_SECONDS,
+    STAGE_SECONDS,
+    UPSTREAM_SECONDS,
+    UPSTREAM_RESPONSES,
+    WEATHER_FALLBACKS,
+]
+STATS: list[tuple[str, Callable[[], dict], frozenset[str], dict[str, str]]] = []
+
+_timings: ContextVar[dict[str, float] | None] = ContextVar("timings", default=None)
+
+
+def register_stats(
+    prefix: str,
+    stats: Callable[[], dict],
+    counters: Iterable[str] = (),
+    **labels: str,
+):
+    """
+    Export the numbers from a `stats()` dict (e.g. a cache's) on /metrics, as
+    `<prefix>_<stat>`. Stats named in `counters` are exported as counters,
+    everything else as gauges.
+    """
+    STATS.append((prefix, stats, frozenset(counters), labels))
+
+
+def collect_stats():
+    samples: dict[str, tuple[str, list[str]]] = {}
+    for prefix, stats, counters, labels in STATS:
+        label_text = format_labels(tuple(labels), tuple(labels.values()))
+        for stat, value in stats().items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+
+            if stat in counters:
+                name, kind = f"{prefix}_{stat}_total", "counter"
+            else:
+                name, kind = f"{prefix}_{stat}", "gauge"
+            samples.setdefault(name, (kind, []))[1].append(
+                f"{name}{label_text} {value}"
+            )
+
+    for name, (kind, lines) in samples.items():
+        yield f"# TYPE {name} {kind}"
+        yield from lines
+
+
+class StageTimer:
+    __slots__ = ("stage", "start")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        STAGE_SECONDS.observe(elapsed, stage=self.stage)
+        timings = _timings.get()
+        if timings is not None:
+            timings[self.stage] = timings.get(self.stage, 0.0) + elapsed
+
+
+NOOP_TIMER = nullcontext()
+
+
+def timed(stage: str):
+    if not METRICS_ENABLED:
+        return NOOP_TIMER
+    return StageTimer(stage)
+
+
+def start_request_timings():
+    timings = {}
+    _timings.set(timings)
+    return timings
+
+
+def format_server_timing(timings: dict[str, float], total: float | None = None):
+    entries = [
+        f"{stage};dur={elapsed * 1000:.2f}" for stage, elapsed in timings.items()
+    ]
+    if total is not None:
+        entries.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(entries)
+
+
+def render_metrics():
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.collect())
+
+    lines.extend(collect_stats())
+
+    return "\n".join(lines) + "\n"
+
+
+def observe_upstream(elapsed: float, status: int | str):
+    if METRICS_ENABLED:
+        UPSTREAM_SECONDS.observe(elapsed)
+        UPSTREAM_RESPONSES.inc(status=status)
+
+
+def observe_fallback(kind: str):
+    if METRICS_ENABLED:
+        WEATHER_FALLBACKS.inc(kind=kind)
+
+
+class ServerTimingMiddleware:
+    """
+    Times every HTTP request, adds a `Server-Timing` header with the stages
+    recorded via `timed()`, and feeds the request duration histogram.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        timings = start_request_timings()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                server_timing = format_server_timing(
+                    timings, time.perf_counter() - start
+                )
+                message = {
+                    **message,
+                    "headers": [
+                        *message.get("headers", []),
+                        (b"server-timing", server_timing.encode()),
+                    ],
+                }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            # Label by route template, not raw path, to bound cardinality
+            route = scope.get("route")
+            REQUEST_SECONDS.observe(
+                time.perf_counter() - start,
+                path=getattr(route, "path", "unmatched"),
+                status=status,
+            )
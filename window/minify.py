@@ -0,0 +1,108 @@
+import re
+
+NUMERIC_ATTRIBUTES = (
+    "cx",
+    "cy",
+    "d",
+    "dx",
+    "dy",
+    "fill-opacity",
+    "gradientTransform",
+    "height",
+    "offset",
+    "opacity",
+    "points",
+    "r",
+    "rx",
+    "ry",
+    "stop-opacity",
+    "stroke-width",
+    "transform",
+    "values",
+    "viewBox",
+    "width",
+    "x",
+    "x1",
+    "x2",
+    "y",
+    "y1",
+    "y2",
+)
+
+NUMERIC_ATTRIBUTE_RE = re.compile(
+    r"(\s(?:%s)=\")([^\"{]*)(\")" % "|".join(map(re.escape, NUMERIC_ATTRIBUTES))
+)
+NUMBER_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+STYLE_RE = re.compile(r"(<style[^>]*>)(.*?)(</style>)", re.DOTALL)
+CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+CSS_SPACE_RE = re.compile(r"\s*([{};:,])\s*")
+DEFINITION_RE = re.compile(
+    r"<(linearGradient|radialGradient|clipPath|filter|mask|pattern)\b"
+    r"[^>]*\sid=\"([^\"]+)\"[^>]*>.*?</\1>",
+    re.DOTALL,
+)
+CLIP_PATH_RE = re.compile(r"\sclip-path=\"url\(#([^)\"]+)\)\"")
+
+
+def format_number(value: float, precision: int):
+    text = f"{round(value, precision):.{precision}f}"
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    if text in ("", "-0"):
+        return "0"
+    if text.startswith("0."):
+        return text[1:]
+    if text.startswith("-0."):
+        return "-" + text[2:]
+    return text
+
+
+def reduce_precision(svg: str, precision: int):
+    def replace_number(match: re.Match):
+        return format_number(float(match.group()), precision)
+
+    def replace_attribute(match: re.Match):
+        value = NUMBER_RE.sub(replace_number, match.group(2))
+        return match.group(1) + value + match.group(3)
+
+    return NUMERIC_ATTRIBUTE_RE.sub(replace_attribute, svg)
+
+
+def minify_css(css: str):
+    css = CSS_COMMENT_RE.sub("", css)
+    css = CSS_SPACE_RE.sub(r"\1", css)
+    return css.strip()
+
+
+def drop_unused_definitions(svg: str):
+    while True:
+        unused = [
+            match
+            for match in DEFINITION_RE.finditer(svg)
+            if f"#{match.group(2)})" not in svg and f'"#{match.group(2)}"' not in svg
+        ]
+        if not unused:
+            break
+        for match in reversed(unused):
+            svg = svg[: match.start()] + svg[match.end() :]
+
+    # A clip-path pointing at a missing element is ignored by renderers
+    defined = {match.group(2) for match in DEFINITION_RE.finditer(svg)}
+    return CLIP_PATH_RE.sub(
+        lambda match: match.group() if match.group(1) in defined else "", svg
+    )
+
+
+def minify_svg(svg: str, precision: int = 2, drop_unused_defs: bool = True):
+    svg = STYLE_RE.sub(
+        lambda match: match.group(1) + minify_css(match.group(2)) + match.group(3),
+        svg,
+    )
+    svg = reduce_precision(svg, precision)
+    if drop_unused_defs:
+        svg = drop_unused_definitions(svg)
+    svg = re.sub(r">\s+", ">", svg)
+    svg = re.sub(r"\s+<", "<", svg)
+    svg = re.sub(r"\s*/>", "/>", svg)
+    svg = re.sub(r"\}\s+\{", "}{", svg)
+    return svg.strip()
@@ -0,0 +1,106 @@
+import asyncio
+from collections import Counter
+import logging
+from typing import Any, Awaitable, Callable, Hashable
+
+from .cache import TTLCache
+from .constants import (
+    PREFETCH_INTERVAL,
+    PREFETCH_LEAD_TIME,
+    PREFETCH_MAX_CONCURRENCY,
+    PREFETCH_TOP_K,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PrefetchScheduler:
+    def __init__(
+        self,
+        cache: TTLCache,
+        loader: Callable[[Hashable], Awaitable[Any]],
+        top_k: int = PREFETCH_TOP_K,
+        lead_time: float = PREFETCH_LEAD_TIME,
+        max_concurrency: int = PREFETCH_MAX_CONCURRENCY,
+        interval: float = PREFETCH_INTERVAL,
+        decay_factor: float = 0.9,
+    ):
+        self.cache = cache
+        self.loader = loader
+        self.top_k = top_k
+        self.lead_time = lead_time
+        self.max_concurrency = max_concurrency
+        self.interval = interval
+        self.decay_factor = decay_factor
+
+        self.counts: Counter[Hashable] = Counter()
+        self.refreshes = 0
+        self.failures = 0
+        self._task: asyncio.Task | None = None
+
+    def record(self, key: Hashable):
+        self.counts[key] += 1
+
+    def hot_keys(self):
+        return [key for key, _ in self.counts.most_common(self.top_k)]
+
+    def due_keys(self):
+        due = []
+        for key in self.hot_keys():
+            remaining = self.cache.time_to_expiry(key)
+            if remaining is None or remaining <= self.lead_time:
+                due.append(key)
+        return due
+
+    async def refresh(self, keys: list[Hashable]):
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def refresh_key(key: Hashable):
+            async with semaphore:
+                try:
+                    await self.cache.refresh_async(key, lambda: self.loader(key))
+                    self.refreshes += 1
+                except Exception:
+                    self.failures += 1
+                    logger.warning("Failed to prefetch %s", key, exc_info=True)
+
+        await asyncio.gather(*(refresh_key(key) for key in keys))
+
+    def decay(self):
+        # Fade counts every tick so popularity follows recent traffic
+        for key, count in list(self.counts.items()):
+            count *= self.decay_factor
+            if count < 0.5:
+                del self.counts[key]
+            else:
+                self.counts[key] = count
+
+    async def run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.refresh(self.due_keys())
+            self.decay()
+
+    def start(self):
+        if self._task is None and self.top_k > 0:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self):
+        return {
+            "tracked": len(self.counts),
+            "top_k": self.top_k,
+            "lead_time": self.lead_time,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+        }
@@ -0,0 +1,266 @@
+from datetime import date, datetime, timedelta, timezone
+from hashlib import blake2b
+import marshal
+from typing import NamedTuple
+from xml.sax.saxutils import escape
+
+from .backends import create_backend
+from .cache import TTLCache
+from .colors import getContrastColor
+from .compression import encode_chunks
+from .constants import (
+    CACHE_MAX_AGE,
+    DEFAULT_UNITS,
+    FALLBACK_MAX_AGE,
+    RENDER_CACHE_MAXSIZE,
+    RENDER_CACHE_TTL,
+)
+from .icons import get_celestial_body_svg, get_weather_icon_svg
+from .metrics import register_stats, timed
+from .sky import get_sky_gradient
+from .solar import get_local_sun_times, get_local_time, get_utc_offset
+from .template import WINDOW_SVG
+from .types import UnitEnum
+
+
+class RenderedWindow(NamedTuple):
+    svg: bytes
+    etag: str
+    # When the sky colours (and therefore the svg) next change, in UTC
+    expires_at: datetime
+    # Rendered from fallback weather (the last good payload, or just the sky)
+    fallback: bool
+    chunks: tuple[bytes, ...]
+    # Compressed variants of `svg`, filled in on first use
+    encoded: dict[str, bytes]
+
+    def max_age(self, now: datetime | None = None) -> int:
+        now = now or datetime.now(timezone.utc)
+        return max(0, int((self.expires_at - now).total_seconds()))
+
+    def encode(self, encoding: str) -> bytes:
+        if encoding == "identity":
+            return self.svg
+
+        body = self.encoded.get(encoding)
+        if body is None:
+            body = encode_chunks(self.chunks, encoding)
+            self.encoded[encoding] = body
+        return body
+
+    def encoded_etag(self, encoding: str) -> str:
+        if encoding == "identity":
+            return self.etag
+        return f'{self.etag[:-1]}-{encoding}"'
+
+
+def dump_rendered_window(window: RenderedWindow) -> bytes:
+    # `svg` is just the joined chunks and `encoded` is rebuilt on demand, so
+    # only the chunks are stored
+    return marshal.dumps(
+        (
+            window.chunks,
+            window.etag,
+            window.expires_at.timestamp(),
+            window.fallback,
+        )
+    )
+
+
+def load_rendered_window(data: bytes) -> RenderedWindow:
+    # Rows written before `fallback` was stored don't have it
+    chunks, etag, expires_at, *fallback = marshal.loads(data)
+    return RenderedWindow(
+        svg=b"".join(chunks),
+        etag=etag,
+        expires_at=datetime.fromtimestamp(expires_at, timezone.utc),
+        fallback=bool(fallback and fallback[0]),
+        chunks=chunks,
+        encoded={},
+    )
+
+
+render_cache = TTLCache(
+    ttl=RENDER_CACHE_TTL,
+    maxsize=RENDER_CACHE_MAXSIZE,
+    backend=create_backend(
+        "render",
+        RENDER_CACHE_MAXSIZE,
+        dumps=dump_rendered_window,
+        loads=load_rendered_window,
+    ),
+)
+register_stats(
+    "livewindow_cache", render_cache.stats, TTLCache.COUNTERS, cache="render"
+)
+
+
+def get_units_symbol(units: UnitEnum):
+    if units == "metric":
+        return "°C"
+    elif units == "imperial":
+        return "°F"
+    else:
+        return "K"
+
+
+def get_local_clock(weather_data: dict, now: datetime | None = None):
+    # The sky follows the location's wall clock, not the server's
+    utc_offset = get_utc_offset(weather_data["coord"]["lon"], weather_data)
+    return utc_offset, get_local_time(utc_offset, now)
+
+
+def get_sun_times(weather_data: dict, utc_offset: timedelta, day: date):
+    coord = weather_data["coord"]
+    return get_local_sun_times(coord["lat"], coord["lon"], utc_offset, day)
+
+
+def get_window_gradient(weather_data: dict, now: datetime | None = None):
+    utc_offset, local_now = get_local_clock(weather_data, now)
+    sunrise_time, sunset_time = get_sun_times(
+        weather_data, utc_offset, local_now.date()
+    )
+    return get_sky_gradient(sunrise_time, sunset_time, local_now)
+
+
+def to_utc(local_time: datetime, utc_offset: timedelta):
+    return (local_time - utc_offset).replace(tzinfo=timezone.utc)
+
+
+def get_color_bucket(local_now: datetime):
+    # Sky colours are resolved per minute, so every render within the same
+    # minute shares a gradient (and a cache entry)
+    return local_now.replace(second=0, microsecond=0)
+
+
+def get_next_color_change(
+    sunrise_time: datetime,
+    sunset_time: datetime,
+    bucket: datetime,
+    gradient: dict,
+    limit: int = CACHE_MAX_AGE,
+):
+    for minutes in range(1, limit // 60 + 1):
+        next_bucket = bucket + timedelta(minutes=minutes)
+        next_gradient = get_sky_gradient(sunrise_time, sunset_time, next_bucket)
+        if next_gradient != gradient:
+            return next_bucket
+
+    return bucket + timedelta(seconds=limit)
+
+
+def get_render_key(weather_data: dict, units: UnitEnum, gradient: dict):
+    weather = weather_data["weather"][0]
+    return (
+        getattr(units, "value", units),
+        weather_data["name"],
+        weather_data["main"].get("temp"),
+        weather["description"],
+        weather["icon"],
+        weather_data.get("fallback", False),
+        tuple(gradient["start"][part] for part in "rgb"),
+        tuple(gradient["end"][part] for part in "rgb"),
+    )
+
+
+def get_etag(render_key: tuple):
+    digest = blake2b(repr(render_key).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def format_rgb(color: dict):
+    return f"rgb({color['r']}, {color['g']}, {color['b']})"
+
+
+def get_currently_text(weather_data: dict, units: UnitEnum = DEFAULT_UNITS):
+    temp = weather_data["main"].get("temp")
+    if temp is None:
+        # Placeholder weather, the window shows only the sky
+        return ""
+
+    symbol = get_units_symbol(units)
+    return f"{temp}{symbol}, {weather_data['weather'][0]['description']}"
+
+
+def render_window_chunks(
+    weather_data: dict,
+    units: UnitEnum = DEFAULT_UNITS,
+    gradient: dict | None = None,
+):
+    if gradient is None:
+        gradient = get_window_gradient(weather_data)
+
+    location = weather_data["name"]
+    currently = get_currently_text(weather_data, units)
+
+    start_color = format_rgb(gradient["start"])
+    end_color = format_rgb(gradient["end"])
+    text_color = getContrastColor(gradient["end"])
+
+    with timed("icons"):
+        weather_icon = weather_data["weather"][0]["icon"]
+        celestial_body_svg = get_celestial_body_svg(weather_icon)
+        weather_icon_svg = get_weather_icon_svg(weather_icon)
+
+    with timed("svg"):
+        return WINDOW_SVG.render_chunks(
+            start_color=start_color,
+            end_color=end_color,
+            start_color_animation=b"",
+            end_color_animation=b"",
+            text_color=text_color,
+            location=escape(location),
+            currently=escape(currently),
+            celestial_body_svg=celestial_body_svg,
+            weather_icon_svg=weather_icon_svg or b"",
+        )
+
+
+def render_window_svg(
+    weather_data: dict,
+    units: UnitEnum = DEFAULT_UNITS,
+    gradient: dict | None = None,
+):
+    return b"".join(render_window_chunks(weather_data, units, gradient))
+
+
+def render_window(
+    weather_data: dict,
+    units: UnitEnum = DEFAULT_UNITS,
+    now: datetime | None = None,
+):
+    with timed("sky"):
+        utc_offset, local_now = get_local_clock(weather_data, now)
+        bucket = get_color_bucket(local_now)
+        sunrise_time, sunset_time = get_sun_times(
+            weather_data, utc_offset, bucket.date()
+        )
+        gradient = get_sky_gradient(sunrise_time, sunset_time, bucket)
+
+    key = get_render_key(weather_data, units, gradient)
+    # Fallback windows are replaced as soon as real weather is back
+    max_age = FALLBACK_MAX_AGE if weather_data.get("fallback") else CACHE_MAX_AGE
+
+    def load():
+        chunks = tuple(render_window_chunks(weather_data, units, gradient))
+        return RenderedWindow(
+            svg=b"".join(chunks),
+            etag=get_etag(key),
+            expires_at=to_utc(
+                get_next_color_change(
+                    sunrise_time, sunset_time, bucket, gradient, max_age
+                ),
+                utc_offset,
+            ),
+            fallback=bool(weather_data.get("fallback")),
+            chunks=chunks,
+            encoded={},
+        )
+
+    rendered = render_cache.get_or_load(key, load)
+    if rendered.expires_at <= to_utc(bucket, utc_offset):
+        # Same colours seen again later in the day, refresh the expiry
+        rendered = load()
+        render_cache.set(key, rendered)
+
+    return rendered
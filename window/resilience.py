@@ -0,0 +1,131 @@
+import asyncio
+import threading
+import time
+
+
+class UpstreamUnavailable(Exception):
+    pass
+
+
+class RateLimited(UpstreamUnavailable):
+    pass
+
+
+class CircuitOpen(UpstreamUnavailable):
+    pass
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        # Tokens added per second, and the most that can be saved up
+        self.rate = rate
+        self.capacity = capacity
+
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        with self._lock:
+            self._refill()
+            if self.tokens < tokens:
+                self.rejected += 1
+                return False
+
+            self.tokens -= tokens
+            return True
+
+    async def acquire(self, tokens: float = 1):
+        # Waits for the tokens instead, for callers that would rather be
+        # paced than turned away
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            await asyncio.sleep(wait)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "tokens": self.tokens,
+                "capacity": self.capacity,
+                "rejected": self.rejected,
+            }
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        # How long to fail fast before letting a trial call through
+        self.reset_timeout = reset_timeout
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.short_circuited = 0
+        self.trips = 0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    self.short_circuited += 1
+                    return False
+                self.state = self.HALF_OPEN
+
+            if self.state == self.HALF_OPEN:
+                # Only one trial call at a time, everyone else keeps failing fast
+                if self._trial_running:
+                    self.short_circuited += 1
+                    return False
+                self._trial_running = True
+
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_running = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.trips += 1
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        # The call ended without telling us anything about the upstream
+        with self._lock:
+            self._trial_running = False
+
+    def stats(self):
+        with self._lock:
+            return {
+                "open": int(self.state == self.OPEN),
+                "half_open": int(self.state == self.HALF_OPEN),
+                "failures": self.failures,
+                "trips": self.trips,
+                "short_circuited": self.short_circuited,
+            }
@@ -0,0 +1,127 @@
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+
+import numpy as np
+
+from .constants import (
+    HOURS_IN_DAY,
+    MINUTES_IN_HOUR,
+    SKY_TABLE_CACHE_SIZE,
+    SUNRISE_COLOR_IDX,
+    SUNSET_COLOR_IDX,
+    TIME_COLORS,
+)
+
+MINUTES_IN_DAY = HOURS_IN_DAY * MINUTES_IN_HOUR
+US_IN_MINUTE = 60 * 1_000_000
+US_IN_DAY = MINUTES_IN_DAY * US_IN_MINUTE
+
+# The gradient starts at the colour from an hour ago, so every table also
+# holds the last hour of the previous day
+TABLE_OFFSET = MINUTES_IN_HOUR
+
+BEFORE_SUNRISE, AFTER_SUNSET, DAYTIME = 0, 1, 2
+
+
+def _build_phase_colors():
+    phases = [
+        TIME_COLORS[0 : SUNRISE_COLOR_IDX + 1],
+        TIME_COLORS[SUNSET_COLOR_IDX:] + [TIME_COLORS[0]],
+        TIME_COLORS[SUNRISE_COLOR_IDX : SUNSET_COLOR_IDX + 1],
+    ]
+    size = max(len(phase) for phase in phases)
+    colors = np.zeros((len(phases), size, 3), dtype=np.int64)
+    for phase_idx, phase in enumerate(phases):
+        for color_idx, color in enumerate(phase):
+            colors[phase_idx, color_idx] = [color["r"], color["g"], color["b"]]
+
+    segments = np.array([len(phase) - 1 for phase in phases], dtype=np.int64)
+    return colors, segments
+
+
+PHASE_COLORS, PHASE_SEGMENTS = _build_phase_colors()
+
+
+def _to_us(delta: timedelta):
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _divide_and_round(a: np.ndarray, b: np.ndarray):
+    # Same round-half-to-even integer division as `timedelta / int`
+    q, r = np.divmod(a, b)
+    r = r * 2
+    return q + ((r > b) | ((r == b) & (q % 2 == 1)))
+
+
+def build_sky_table(sunrise_time: datetime, sunset_time: datetime, day: date):
+    """
+    Sky colour for every minute of `day` (plus the hour before it), as a
+    read-only `(1500, 3)` uint8 array. Row `TABLE_OFFSET + minute` matches
+    `getRealisticColor` at that minute.
+    """
+    midnight = datetime.combine(day, time())
+    sunrise = _to_us(sunrise_time - midnight)
+    sunset = _to_us(sunset_time - midnight)
+    sunset_day_end = _to_us(
+        datetime.combine(sunset_time.date(), time(23, 59, 59, 999)) - midnight
+    )
+
+    now = np.arange(-TABLE_OFFSET, MINUTES_IN_DAY, dtype=np.int64) * US_IN_MINUTE
+    day_start = np.where(now < 0, -US_IN_DAY, 0)
+
+    before = now < sunrise
+    after = ~before & (now >= sunset)
+    phase = np.select([before, after], [BEFORE_SUNRISE, AFTER_SUNSET], DAYTIME)
+    phase_start = np.select([before, after], [day_start, sunset], sunrise)
+    phase_end = np.select([before, after], [sunrise, sunset_day_end], sunset)
+
+    segments = PHASE_SEGMENTS[phase]
+    time_in_phase = phase_end - phase_start
+    distance = (now - phase_start) / time_in_phase
+
+    start_idx = np.clip(np.floor(segments * distance).astype(np.int64), 0, segments)
+    end_idx = np.minimum(start_idx + 1, segments)
+
+    segment_time = _divide_and_round(time_in_phase, segments)
+    start_color_time = phase_start + start_idx * segment_time
+    end_color_time = phase_start + end_idx * segment_time
+    time_in_segment = end_color_time - start_color_time
+    distance_in_segment = np.where(
+        time_in_segment != 0,
+        (now - start_color_time) / np.where(time_in_segment != 0, time_in_segment, 1),
+        1.0,
+    )
+
+    start_color = PHASE_COLORS[phase, start_idx]
+    end_color = PHASE_COLORS[phase, end_idx]
+    blend = start_color + (end_color - start_color) * distance_in_segment[:, None]
+
+    table = np.rint(blend).astype(np.uint8)
+    table.flags.writeable = False
+    return table
+
+
+@lru_cache(maxsize=SKY_TABLE_CACHE_SIZE)
+def get_sky_table(sunrise_time: datetime, sunset_time: datetime, day: date):
+    return build_sky_table(sunrise_time, sunset_time, day)
+
+
+def _to_color(row: np.ndarray):
+    r, g, b = row.tolist()
+    return {"r": r, "g": g, "b": b}
+
+
+def get_sky_gradient(
+    sunrise_time: datetime, sunset_time: datetime, now: datetime | None = None
+):
+    now = now or datetime.now()
+    table = get_sky_table(sunrise_time, sunset_time, now.date())
+    idx = TABLE_OFFSET + now.hour * MINUTES_IN_HOUR + now.minute
+
+    gradient_start = _to_color(table[idx - MINUTES_IN_HOUR])
+    gradient_end = _to_color(table[idx])
+
+    if now >= sunset_time:
+        return {"start": gradient_end, "end": gradient_start}
+
+    return {"start": gradient_start, "end": gradient_end}
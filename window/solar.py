@@ -0,0 +1,90 @@
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from math import acos, cos, degrees, pi, radians, sin, tan
+
+from .constants import SOLAR_PRECISION, SUN_TIMES_CACHE_SIZE
+
+# Sun's centre 0.833° below the horizon: refraction plus its radius
+SUNRISE_ZENITH = radians(90.833)
+
+
+def get_utc_offset(lon: float, weather_data: dict | None = None) -> timedelta:
+    # OpenWeather reports the location's real offset (DST included), without
+    # it fall back to the nautical time zone for the longitude
+    if weather_data and "timezone" in weather_data:
+        return timedelta(seconds=weather_data["timezone"])
+    return timedelta(hours=round(lon / 15))
+
+
+def get_local_time(utc_offset: timedelta, now: datetime | None = None) -> datetime:
+    """
+    `now` (default: the current time) as naive wall-clock time at the
+    location. Naive datetimes are taken to be in UTC.
+    """
+    now = now or datetime.now(timezone.utc)
+    if now.tzinfo is not None:
+        now = now.astimezone(timezone.utc).replace(tzinfo=None)
+    return now + utc_offset
+
+
+def compute_sun_times_utc(lat: float, lon: float, day: date):
+    """
+    Sunrise and sunset on `day` as naive UTC datetimes, using the NOAA
+    approximations (accurate to about a minute).
+    """
+    gamma = 2 * pi / 365 * (day.timetuple().tm_yday - 1)
+    equation_of_time = 229.18 * (
+        0.000075
+        + 0.001868 * cos(gamma)
+        - 0.032077 * sin(gamma)
+        - 0.014615 * cos(2 * gamma)
+        - 0.040849 * sin(2 * gamma)
+    )
+    declination = (
+        0.006918
+        - 0.399912 * cos(gamma)
+        + 0.070257 * sin(gamma)
+        - 0.006758 * cos(2 * gamma)
+        + 0.000907 * sin(2 * gamma)
+        - 0.002697 * cos(3 * gamma)
+        + 0.00148 * sin(3 * gamma)
+    )
+
+    lat_rad = radians(lat)
+    cos_hour_angle = cos(SUNRISE_ZENITH) / (cos(lat_rad) * cos(declination)) - tan(
+        lat_rad
+    ) * tan(declination)
+    # Polar night collapses the day to solar noon, midnight sun stretches it
+    # over all 24 hours
+    hour_angle = degrees(acos(min(1.0, max(-1.0, cos_hour_angle))))
+
+    midnight = datetime.combine(day, time())
+    solar_noon = 720 - 4 * lon - equation_of_time
+    sunrise = midnight + timedelta(minutes=solar_noon - 4 * hour_angle)
+    sunset = midnight + timedelta(minutes=solar_noon + 4 * hour_angle)
+    # Whole seconds, so the same day always gives the same sky table key
+    return sunrise.replace(microsecond=0), sunset.replace(microsecond=0)
+
+
+def quantise_coordinates(lat: float, lon: float, precision: int = SOLAR_PRECISION):
+    return round(lat, precision), round(lon, precision)
+
+
+@lru_cache(maxsize=SUN_TIMES_CACHE_SIZE)
+def get_sun_times_utc(lat: float, lon: float, day: date):
+    return compute_sun_times_utc(lat, lon, day)
+
+
+def get_local_sun_times(lat: float, lon: float, utc_offset: timedelta, day: date):
+    """
+    Sunrise and sunset on the local `day` at the location, as naive
+    wall-clock times there. Memoised per quantised location and date.
+    """
+    lat, lon = quantise_coordinates(lat, lon)
+    # The UTC day whose solar noon falls on the local `day`. They differ
+    # where the time zone is far from the longitude's, e.g. UTC+13 at -172°
+    utc_day = day - timedelta(
+        days=round((utc_offset.total_seconds() / 3600 - lon / 15) / 24)
+    )
+    sunrise, sunset = get_sun_times_utc(lat, lon, utc_day)
+    return sunrise + utc_offset, sunset + utc_offset
@@ -0,0 +1,54 @@
+/*
+ * Live Window embed: inlines the window into every element with a
+ * `data-live-window` attribute (the URL of /api/live/) and patches it in place
+ * as the server pushes changes.
+ *
+ *   <div data-live-window="https://livewindow-api.onrender.com/api/live/?location=40.7128,-74.0060"></div>
+ *   <script src="https://livewindow-api.onrender.com/live.js" async></script>
+ */
+(function () {
+  var GRADIENT = "#paint2_linear_331_346 stop";
+
+  function setAll(svg, selector, name, value) {
+    svg.querySelectorAll(selector).forEach(function (el) {
+      el.setAttribute(name, value);
+    });
+  }
+
+  function setText(svg, selector, value) {
+    var el = svg.querySelector(selector);
+    if (el) el.textContent = value;
+  }
+
+  function setMarkup(svg, selector, value) {
+    var el = svg.querySelector(selector);
+    if (el) el.innerHTML = value;
+  }
+
+  function patch(svg, delta) {
+    var stops = svg.querySelectorAll(GRADIENT);
+    if ("start_color" in delta) stops[0].setAttribute("stop-color", delta.start_color);
+    if ("end_color" in delta) stops[1].setAttribute("stop-color", delta.end_color);
+    if ("text_color" in delta) setAll(svg, ".location-text, .currently-text", "fill", delta.text_color);
+    if ("location" in delta) setText(svg, ".location-text", delta.location);
+    if ("currently" in delta) setText(svg, ".currently-text", delta.currently);
+    if ("celestial_body_svg" in delta) setMarkup(svg, ".celestial-body", delta.celestial_body_svg);
+    if ("weather_icon_svg" in delta) setMarkup(svg, ".weather-icon", delta.weather_icon_svg);
+  }
+
+  function connect(el) {
+    var source = new EventSource(el.getAttribute("data-live-window"));
+
+    // Sent on every (re)connect
+    source.addEventListener("window", function (event) {
+      el.innerHTML = JSON.parse(event.data).svg;
+    });
+
+    source.addEventListener("delta", function (event) {
+      var svg = el.querySelector("svg");
+      if (svg) patch(svg, JSON.parse(event.data));
+    });
+  }
+
+  document.querySelectorAll("[data-live-window]").forEach(connect);
+})();
@@ -0,0 +1,52 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import AsyncIterator
+
+from . import create_admitted_window
+from .compression import STREAM_ENCODINGS
+from .constants import DEFAULT_LANG, DEFAULT_LOCATION, DEFAULT_UNITS
+from .metrics import timed
+from .template import WINDOW_SVG
+from .types import UnitEnum
+
+
+def get_stream_max_age(now: datetime | None = None) -> int:
+    # Headers go out before the window is rendered, so the only safe bound is
+    # the end of the current minute, before which the sky can't change
+    now = now or datetime.now(timezone.utc)
+    return 60 - now.second
+
+
+async def stream_window(
+    units: UnitEnum = DEFAULT_UNITS,
+    lat: float = DEFAULT_LOCATION["lat"],
+    lon: float = DEFAULT_LOCATION["lng"],
+    lang: str = DEFAULT_LANG,
+    encoding: str = "identity",
+) -> AsyncIterator[bytes]:
+    """
+    Yields the window's static prefix (the frame) straight away, and the rest
+    once the weather is in. The bytes are the same as `create_window`'s.
+
+    The weather and render go through admission control like any other
+    `/api/` request. The status has gone out with the frame by the time a
+    request could be shed, so a shed stream always degrades to cached
+    weather, whatever the shed mode.
+    """
+    # Started first so the fetch overlaps with sending the prefix
+    rendered = asyncio.ensure_future(
+        create_admitted_window(units, lat, lon, lang, shed_mode="degrade")
+    )
+    encoder = STREAM_ENCODINGS[encoding]()
+    try:
+        yield encoder.start() + encoder.compress(WINDOW_SVG.prefix)
+
+        window = await rendered
+
+        # The first chunk of every render is the prefix, already sent
+        with timed("encode"):
+            body = [encoder.compress(chunk) for chunk in window.chunks[1:]]
+            body.append(encoder.finish())
+        yield b"".join(body)
+    finally:
+        rendered.cancel()
@@ -0,0 +1,89 @@
+import asyncio
+import logging
+import time
+
+from .compression import SUPPORTED_ENCODINGS
+from .constants import DEFAULT_LANG, DEFAULT_UNITS, WARMUP_LOCATIONS, WARMUP_TIMEOUT
+from .locations import get_canonical_location, parse_location
+from .metrics import register_stats
+from .render import render_window
+from .weather import get_weather_cache_key, load_weather_data, weather_client
+
+logger = logging.getLogger(__name__)
+
+
+class Readiness:
+    def __init__(self):
+        self.ready = False
+        self.warmup_seconds = 0.0
+        self.warmed = 0
+        self.failed = 0
+
+    def report(self):
+        return {
+            "ready": self.ready,
+            "warmup_seconds": self.warmup_seconds,
+            "warmed_locations": self.warmed,
+            "failed_locations": self.failed,
+        }
+
+    def stats(self):
+        # Prometheus gauges need a number
+        return {**self.report(), "ready": int(self.ready)}
+
+
+async def warm_location(lat: float, lon: float):
+    # Straight to the caches, so warming doesn't show up as traffic in the
+    # location report or the prefetcher's top locations
+    key = get_weather_cache_key(DEFAULT_UNITS, lat, lon, DEFAULT_LANG)
+    weather_data = await load_weather_data(key)
+    window = render_window(weather_data, DEFAULT_UNITS)
+    # Sets up the compressors too, and has the encoded variants ready for
+    # what's likely the most requested window
+    for encoding in SUPPORTED_ENCODINGS:
+        window.encode(encoding)
+    return window
+
+
+async def warm_up(locations: str = WARMUP_LOCATIONS, timeout: float = WARMUP_TIMEOUT):
+    """
+    Pays the first request's costs up front: opens the connection pool and
+    renders each location end to end, which makes the first upstream
+    connection and fills the weather, sun times, sky and render caches. The
+    template and icons are already compiled and loaded on import.
+    """
+    start = time.perf_counter()
+    try:
+        await weather_client.start()
+        coordinates = [
+            get_canonical_location(*parse_location(location))
+            for location in locations.split(";")
+            if location.strip()
+        ]
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(warm_location(lat, lon) for lat, lon in coordinates),
+                return_exceptions=True,
+            ),
+            timeout,
+        )
+        for (lat, lon), result in zip(coordinates, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to warm up %s,%s", lat, lon, exc_info=result)
+                readiness.failed += 1
+            else:
+                readiness.warmed += 1
+    except asyncio.TimeoutError:
+        logger.warning("Warm-up took over %ss, carrying on without it", timeout)
+    except Exception:
+        logger.warning("Warm-up failed, carrying on without it", exc_info=True)
+    finally:
+        # A failed warm-up only makes the first requests slower, it's no
+        # reason to keep the instance out of rotation
+        readiness.warmup_seconds = time.perf_counter() - start
+        readiness.ready = True
+        logger.info("Warmed up in %.2fs", readiness.warmup_seconds)
+
+
+readiness = Readiness()
+register_stats("livewindow_readiness", readiness.stats)
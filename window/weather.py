@@ -0,0 +1,393 @@
+import asyncio
+from datetime import datetime
+import logging
+import threading
+import time
+
+import httpx
+
+from .backends import create_backend
+from .cache import TTLCache
+from .constants import (
+    DEFAULT_LOCATION,
+    FORECAST_CACHE_TTL,
+    OPEN_WEATHER_API_KEY,
+    OPEN_WEATHER_BASE_URL,
+    WEATHER_BREAKER_RESET,
+    WEATHER_BREAKER_THRESHOLD,
+    WEATHER_CACHE_MAXSIZE,
+    WEATHER_CACHE_TTL,
+    WEATHER_CONNECT_TIMEOUT,
+    WEATHER_FALLBACK_TTL,
+    WEATHER_LATENCY_BUDGET,
+    WEATHER_MAX_CONNECTIONS,
+    WEATHER_MAX_KEEPALIVE_CONNECTIONS,
+    WEATHER_RATE_BURST,
+    WEATHER_RATE_LIMIT,
+    WEATHER_READ_TIMEOUT,
+    WEATHER_STALE_TTL,
+)
+from .metrics import observe_fallback, observe_upstream, register_stats
+from .prefetch import PrefetchScheduler
+from .resilience import (
+    CircuitBreaker,
+    CircuitOpen,
+    RateLimited,
+    TokenBucket,
+    UpstreamUnavailable,
+)
+from .solar import get_local_sun_times, get_local_time, get_utc_offset
+
+logger = logging.getLogger(__name__)
+
+
+def check_weather_data(weather_data: dict):
+    # Everything rendering relies on, so a bad payload fails here and is
+    # never cached
+    weather_data["name"]
+    weather_data["main"]["temp"]
+    weather_data["weather"][0]["description"]
+    weather_data["weather"][0]["icon"]
+    weather_data["coord"]["lat"]
+    weather_data["coord"]["lon"]
+
+
+def check_forecast_data(forecast_data: dict):
+    forecast_data["city"]["name"]
+    for entry in forecast_data["list"]:
+        entry["dt"]
+        entry["main"]["temp"]
+        entry["weather"][0]["description"]
+        entry["weather"][0]["icon"]
+
+
+class WeatherClient:
+    def __init__(
+        self,
+        base_url: str = OPEN_WEATHER_BASE_URL,
+        api_key: str | None = OPEN_WEATHER_API_KEY,
+        connect_timeout: float = WEATHER_CONNECT_TIMEOUT,
+        read_timeout: float = WEATHER_READ_TIMEOUT,
+        max_connections: int = WEATHER_MAX_CONNECTIONS,
+        max_keepalive_connections: int = WEATHER_MAX_KEEPALIVE_CONNECTIONS,
+        rate_limit: float = WEATHER_RATE_LIMIT,
+        rate_burst: float = WEATHER_RATE_BURST,
+        breaker_threshold: int = WEATHER_BREAKER_THRESHOLD,
+        breaker_reset: float = WEATHER_BREAKER_RESET,
+        pace: bool = False,
+    ):
+        self.base_url = base_url
+        self.api_key = api_key
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.limiter = TokenBucket(rate_limit / 60, rate_burst)
+        # Wait for a call to free up rather than fail fast when out of them,
+        # for bulk jobs that have no user waiting
+        self.pace = pace
+        self.breaker = CircuitBreaker(breaker_threshold, breaker_reset)
+
+        self._client: httpx.AsyncClient | None = None
+        self._sync_client: httpx.Client | None = None
+        self._sync_lock = threading.Lock()
+
+    def _client_options(self):
+        return {
+            "base_url": self.base_url,
+            "timeout": self.timeout,
+            "limits": self.limits,
+        }
+
+    def _params(self, units: str, lat: float, lon: float, lang: str):
+        return {
+            "units": units,
+            "lat": lat,
+            "lon": lon,
+            "lang": lang,
+            "appid": self.api_key,
+        }
+
+    async def start(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(**self._client_options())
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+        with self._sync_lock:
+            if self._sync_client is not None:
+                self._sync_client.close()
+                self._sync_client = None
+
+    def _get_sync_client(self):
+        with self._sync_lock:
+            if self._sync_client is None:
+                self._sync_client = httpx.Client(**self._client_options())
+            return self._sync_client
+
+    def _before_request(self, has_token: bool = False):
+        if not self.breaker.allow():
+            raise CircuitOpen("OpenWeather is failing, not calling it for now")
+        if not has_token and not self.limiter.try_acquire():
+            self.breaker.release()
+            raise RateLimited("Out of OpenWeather calls for now")
+
+    def _handle_response(self, response: httpx.Response, check=check_weather_data):
+        if response.is_success:
+            try:
+                weather_data = response.json()
+                check(weather_data)
+            except (ValueError, LookupError, TypeError) as exc:
+                self.breaker.record_failure()
+                raise UpstreamUnavailable("Malformed OpenWeather response") from exc
+
+            self.breaker.record_success()
+            return weather_data
+
+        # A 4xx other than 429 is our request's fault, not an upstream outage
+        if response.status_code == 429 or response.is_server_error:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        # Never cache error payloads (bad key, rate limited, ...)
+        response.raise_for_status()
+
+    async def _get(self, path: str, params: dict, check=check_weather_data):
+        await self.start()
+        if self.pace:
+            await self.limiter.acquire()
+        self._before_request(has_token=self.pace)
+        start = time.perf_counter()
+        try:
+            response = await self._client.get(path, params=params)
+        except httpx.TransportError:
+            observe_upstream(time.perf_counter() - start, "error")
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+
+        observe_upstream(time.perf_counter() - start, response.status_code)
+        return self._handle_response(response, check)
+
+    async def fetch(self, units: str, lat: float, lon: float, lang: str):
+        return await self._get("/weather", self._params(units, lat, lon, lang))
+
+    async def fetch_forecast(self, units: str, lat: float, lon: float, lang: str):
+        # 5 days in 3 hour steps
+        return await self._get(
+            "/forecast", self._params(units, lat, lon, lang), check_forecast_data
+        )
+
+    def fetch_sync(self, units: str, lat: float, lon: float, lang: str):
+        self._before_request()
+        start = time.perf_counter()
+        try:
+            response = self._get_sync_client().get(
+                "/weather", params=self._params(units, lat, lon, lang)
+            )
+        except httpx.TransportError:
+            observe_upstream(time.perf_counter() - start, "error")
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+
+        observe_upstream(time.perf_counter() - start, response.status_code)
+        return self._handle_response(response)
+
+    def stats(self):
+        return {**self.breaker.stats(), **self.limiter.stats()}
+
+
+weather_client = WeatherClient()
+weather_cache = TTLCache(
+    ttl=WEATHER_CACHE_TTL,
+    maxsize=WEATHER_CACHE_MAXSIZE,
+    stale_ttl=WEATHER_STALE_TTL,
+    backend=create_backend("weather", WEATHER_CACHE_MAXSIZE, grace=WEATHER_STALE_TTL),
+)
+forecast_cache = TTLCache(
+    ttl=FORECAST_CACHE_TTL,
+    maxsize=WEATHER_CACHE_MAXSIZE,
+    backend=create_backend("forecast", WEATHER_CACHE_MAXSIZE),
+)
+# The last payload fetched for each location, kept long after it stops being
+# fresh, to fall back on while OpenWeather is unavailable
+last_good_weather = TTLCache(
+    ttl=WEATHER_FALLBACK_TTL,
+    maxsize=WEATHER_CACHE_MAXSIZE,
+    backend=create_backend("weather_last_good", WEATHER_CACHE_MAXSIZE),
+)
+
+
+async def fetch_weather(key: tuple):
+    weather_data = await weather_client.fetch(*key)
+    last_good_weather.set(key, weather_data)
+    return weather_data
+
+
+def fetch_weather_sync(key: tuple):
+    weather_data = weather_client.fetch_sync(*key)
+    last_good_weather.set(key, weather_data)
+    return weather_data
+
+
+prefetch_scheduler = PrefetchScheduler(weather_cache, fetch_weather)
+register_stats(
+    "livewindow_cache", weather_cache.stats, TTLCache.COUNTERS, cache="weather"
+)
+register_stats(
+    "livewindow_cache", forecast_cache.stats, TTLCache.COUNTERS, cache="forecast"
+)
+register_stats(
+    "livewindow_upstream",
+    weather_client.stats,
+    ("trips", "short_circuited", "rejected"),
+)
+register_stats(
+    "livewindow_prefetch", prefetch_scheduler.stats, ("refreshes", "failures")
+)
+
+
+def get_weather_cache_key(units: str, lat: float, lon: float, lang: str):
+    return (
+        getattr(units, "value", units),
+        float(lat),
+        float(lon),
+        getattr(lang, "value", lang),
+    )
+
+
+def get_placeholder_weather(lat: float, lon: float, now: datetime | None = None):
+    # Just the sky, which only needs the location
+    utc_offset = get_utc_offset(lon)
+    local_now = get_local_time(utc_offset, now)
+    sunrise_time, sunset_time = get_local_sun_times(
+        lat, lon, utc_offset, local_now.date()
+    )
+    is_day = sunrise_time <= local_now < sunset_time
+    return {
+        "coord": {"lat": lat, "lon": lon},
+        "name": "",
+        "main": {},
+        "weather": [{"description": "", "icon": "d" if is_day else "n"}],
+        "fallback": True,
+    }
+
+
+def get_fallback_weather(key: tuple):
+    weather_data = last_good_weather.get(key)
+    if weather_data is not None:
+        observe_fallback("last_good")
+        return {**weather_data, "fallback": True}
+
+    observe_fallback("placeholder")
+    _, lat, lon, _ = key
+    return get_placeholder_weather(lat, lon)
+
+
+def get_cached_weather(
+    units: str = "metric",
+    lat: float = DEFAULT_LOCATION["lat"],
+    lon: float = DEFAULT_LOCATION["lng"],
+    lang: str = "en",
+):
+    """
+    Whatever weather there is without calling upstream: the cached weather if
+    it's fresh, otherwise the fallback.
+    """
+    key = get_weather_cache_key(units, lat, lon, lang)
+    weather_data = weather_cache.get(key)
+    if weather_data is not None:
+        return weather_data
+    return get_fallback_weather(key)
+
+
+UPSTREAM_ERRORS = (asyncio.TimeoutError, httpx.HTTPError, UpstreamUnavailable)
+
+
+def _consume_exception(task: asyncio.Task):
+    if not task.cancelled():
+        task.exception()
+
+
+async def load_within_budget(
+    cache: TTLCache, key: tuple, loader, latency_budget: float
+):
+    load = asyncio.ensure_future(cache.get_or_load_async(key, loader))
+    try:
+        # Shielded so a fetch that blows the budget still lands in the cache
+        return await asyncio.wait_for(asyncio.shield(load), latency_budget)
+    except BaseException:
+        load.add_done_callback(_consume_exception)
+        raise
+
+
+async def get_weather_data(
+    units: str = "metric",
+    lat: float = DEFAULT_LOCATION["lat"],
+    lon: float = DEFAULT_LOCATION["lng"],
+    lang: str = "en",
+    latency_budget: float = WEATHER_LATENCY_BUDGET,
+):
+    key = get_weather_cache_key(units, lat, lon, lang)
+    prefetch_scheduler.record(key)
+    return await load_weather_data(key, latency_budget)
+
+
+async def load_weather_data(key: tuple, latency_budget: float = WEATHER_LATENCY_BUDGET):
+    """
+    The weather for a cache key, without counting it as a request for the
+    prefetcher.
+    """
+    try:
+        return await load_within_budget(
+            weather_cache, key, lambda: fetch_weather(key), latency_budget
+        )
+    except UPSTREAM_ERRORS as exc:
+        logger.warning("Serving fallback weather for %s: %r", key, exc)
+        return get_fallback_weather(key)
+
+
+async def get_forecast_data(
+    units: str = "metric",
+    lat: float = DEFAULT_LOCATION["lat"],
+    lon: float = DEFAULT_LOCATION["lng"],
+    lang: str = "en",
+    latency_budget: float = WEATHER_LATENCY_BUDGET,
+):
+    """
+    The 5 day forecast, or None if it can't be had within the budget.
+    """
+    key = get_weather_cache_key(units, lat, lon, lang)
+    try:
+        return await load_within_budget(
+            forecast_cache,
+            key,
+            lambda: weather_client.fetch_forecast(*key),
+            latency_budget,
+        )
+    except UPSTREAM_ERRORS as exc:
+        logger.warning("No forecast for %s: %r", key, exc)
+        return None
+
+
+def get_weather_data_sync(
+    units: str = "metric",
+    lat: float = DEFAULT_LOCATION["lat"],
+    lon: float = DEFAULT_LOCATION["lng"],
+    lang: str = "en",
+):
+    key = get_weather_cache_key(units, lat, lon, lang)
+    try:
+        return weather_cache.get_or_load(key, lambda: fetch_weather_sync(key))
+    except (httpx.HTTPError, UpstreamUnavailable) as exc:
+        logger.warning("Serving fallback weather for %s: %r", key, exc)
+        return get_fallback_weather(key)